@@ -1,25 +1,22 @@
+import atexit
 import csv
 import json
 import logging
 import os
 import pathlib
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from getpass import getpass
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Callable
-
-import keyring
+from typing import Callable, List
 
 from taskbridge import helpers
 
 import argparse
 
-from taskbridge.notes.controller import NoteController
-from taskbridge.notes.model import notescript
-from taskbridge.reminders.controller import ReminderController
-from taskbridge.reminders.model import reminderscript
-
 
 class TaskBridgeCli:
     """
@@ -47,32 +44,68 @@ class TaskBridgeCli:
         'autosync_interval': 0,
         'autosync_unit': 'Minutes'
     }
+    #: The CalDAV password, as read from the keyring or entered by the user in :py:meth:`authenticate_caldav`.
+    CALDAV_PASSWORD: str | None = None
+    #: Exit code of the first failed synchronisation stage. Once set, synchronisation running alongside the failed one
+    #: stops before its next stage.
+    FAILED_EXIT_CODE: int | None = None
 
     def __init__(self, args):
         self.args = args
+        self.log_listener: QueueListener | None = None
         self.logger = self.setup_logging()
         self.apply_settings()
+        TaskBridgeCli.FAILED_EXIT_CODE = None
+        sync_tasks = []
         if (TaskBridgeCli.SETTINGS['sync_reminders'] == '1'
                 and self.authenticate_caldav() and TaskBridgeCli.preflight_reminders()):
-            TaskBridgeCli.sync_reminders()
+            sync_tasks.append(TaskBridgeCli.sync_reminders)
         if TaskBridgeCli.SETTINGS['sync_notes'] == '1' and TaskBridgeCli.preflight_notes():
-            TaskBridgeCli.sync_notes()
+            sync_tasks.append(TaskBridgeCli.sync_notes)
+        if helpers.DRY_RUN or len(sync_tasks) < 2:
+            for sync_task in sync_tasks:
+                sync_task()
+        else:
+            # Reminder and note synchronisation are independent and I/O bound, so run them side by side. If a stage of one
+            # fails, the other stops before its next stage, and the CLI exits with the code of the failed stage.
+            with ThreadPoolExecutor(max_workers=len(sync_tasks)) as executor:
+                for future in [executor.submit(sync_task) for sync_task in sync_tasks]:
+                    future.result()
         logging.info("Synchronisation tasks completed")
 
     @staticmethod
     def __process_return(cb: Callable, error: str, code: int) -> None:
         """
         Process the return value of one of the controller method. If there is an error, this is logged and the CLI exits.
+        If synchronisation running alongside this one has already failed, the CLI exits without running ``cb``.
 
         :param cb: The controller function to run.
         :param error: The error message to display on failure.
         :param code: The exit code to use on error.
         """
-        success, data = cb()
+        if TaskBridgeCli.FAILED_EXIT_CODE is not None:
+            sys.exit(TaskBridgeCli.FAILED_EXIT_CODE)
+        success, _ = cb()
         if not success:
             logging.critical(error)
+            TaskBridgeCli.FAILED_EXIT_CODE = code
             sys.exit(code)
 
+    @staticmethod
+    def __process_concurrently(*stages: tuple[Callable, str, int]) -> None:
+        """
+        Run independent controller methods, such as fetching local and remote data, at the same time. Return values are
+        then processed in the order given, as per :py:meth:`__process_return`.
+
+        :param stages: the controller function, error message and exit code for each method to run.
+        """
+        if TaskBridgeCli.FAILED_EXIT_CODE is not None:
+            sys.exit(TaskBridgeCli.FAILED_EXIT_CODE)
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = [executor.submit(cb) for cb, _, _ in stages]
+        for future, (_, error, code) in zip(futures, stages):
+            TaskBridgeCli.__process_return(future.result, error, code)
+
     @staticmethod
     def preflight_notes() -> bool:
         """
@@ -101,6 +134,8 @@ class TaskBridgeCli:
         Calls the varous controller methods to perform note synchronisation. If any stage fails, an error message is logged,
         and the CLI exits with a status code.
         """
+        from taskbridge.notes.controller import NoteController
+        from taskbridge.notes.model import notescript
 
         NoteController.REMOTE_NOTE_FOLDER = Path(TaskBridgeCli.SETTINGS['remote_notes_folder'])
         NoteController.ASSOCIATIONS = TaskBridgeCli.SETTINGS['associations']
@@ -111,15 +146,10 @@ class TaskBridgeCli:
         notes_was_running = stdout.strip() == 'true'
 
         # Get folder lists
-        logging.info("Fetching local note folders...")
-        TaskBridgeCli.__process_return(
-            NoteController.get_local_folders,
-            "Error fetching local note folders.", 14)
-
-        logging.info("Fetching remote note folders...")
-        TaskBridgeCli.__process_return(
-            NoteController.get_remote_folders,
-            "Error fetching remote note folders.", 15)
+        logging.info("Fetching local and remote note folders...")
+        TaskBridgeCli.__process_concurrently(
+            (NoteController.get_local_folders, "Error fetching local note folders.", 14),
+            (NoteController.get_remote_folders, "Error fetching remote note folders.", 15))
 
         # Sync deletions
         logging.info("Synchronising deleted note folders...")
@@ -183,12 +213,14 @@ class TaskBridgeCli:
         Calls the varous controller methods to perform reminder synchronisation. If any stage fails, an error message is
         logged, and the CLI exits with a status code.
         """
+        from taskbridge.reminders.controller import ReminderController
+        from taskbridge.reminders.model import reminderscript
 
         caldav_url = TaskBridgeCli.SETTINGS['caldav_server'] + TaskBridgeCli.SETTINGS['caldav_path']
         ReminderController.CALDAV_URL = caldav_url
         ReminderController.CALDAV_USERNAME = TaskBridgeCli.SETTINGS['caldav_username']
         ReminderController.CALDAV_HEADERS = {}
-        ReminderController.CALDAV_PASSWORD = keyring.get_password("TaskBridge", "CALDAV-PWD")
+        ReminderController.CALDAV_PASSWORD = TaskBridgeCli.CALDAV_PASSWORD
         ReminderController.TO_SYNC = TaskBridgeCli.SETTINGS['reminder_sync']
 
         # Check if the Reminders app is running
@@ -203,14 +235,10 @@ class TaskBridgeCli:
             "Failed to connect to CalDAV server.", 5)
 
         # Get reminder lists
-        logging.info("Fetching local reminder lists...")
-        TaskBridgeCli.__process_return(
-            ReminderController.fetch_local_reminders,
-            "Error fetching local reminder lists.", 6)
-        logging.info("Fetching remote reminder lists...")
-        TaskBridgeCli.__process_return(
-            ReminderController.fetch_remote_reminders,
-            "Error fetching remote reminder lists.", 7)
+        logging.info("Fetching local and remote reminder lists...")
+        TaskBridgeCli.__process_concurrently(
+            (ReminderController.fetch_local_reminders, "Error fetching local reminder lists.", 6),
+            (ReminderController.fetch_remote_reminders, "Error fetching remote reminder lists.", 7))
 
         # Sync deletions
         logging.info("Synchronising deleted reminder containers...")
@@ -257,15 +285,18 @@ class TaskBridgeCli:
     def authenticate_caldav(self) -> bool:
         """
         Performs CalDAV authentication. If the --caldav-password option is used, this method will ask for a CalDAV password
-        regardless of whether one is saved. If no password is saved, the CLI exits with an error.
+        regardless of whether one is saved. If no password is saved, the CLI exits with an error. The password is kept in
+        :py:attr:`CALDAV_PASSWORD` for reminder synchronisation, so the keyring is only queried once.
 
         :return: True on finding or receiving a CalDAV password.
         """
+        import keyring
 
         if 'caldav_password' in self.args:
             # User specifically wants to be asked for password
             new_password = getpass('CalDAV Password> ')
             keyring.set_password("TaskBridge", "CALDAV-PWD", new_password)
+            TaskBridgeCli.CALDAV_PASSWORD = new_password
             return True
 
         # Check if password is in keyring
@@ -273,6 +304,7 @@ class TaskBridgeCli:
         if password is None:
             logging.critical('No CalDAV Password in keyring. Use --caldav-password to be prompted for a password.')
             sys.exit(3)
+        TaskBridgeCli.CALDAV_PASSWORD = password
         return True
 
     def apply_settings(self) -> None:
@@ -287,21 +319,22 @@ class TaskBridgeCli:
             # Load settings from custom configuration file
             if os.path.exists(self.args.config):
                 conf_file = self.args.config
-                self.logger.info('Using custom config file: {}'.format(conf_file))
+                self.logger.info('Using custom config file: %s', conf_file)
             else:
-                self.logger.critical('Configuration file {} not found.'.format(self.args.config))
+                self.logger.critical('Configuration file %s not found.', self.args.config)
                 sys.exit(2)
         else:
             # Load settings from default configuration file
             conf_file = helpers.settings_folder() / 'conf.json'
-            self.logger.info('Using default config file: {}'.format(conf_file))
+            self.logger.info('Using default config file: %s', conf_file)
 
         TaskBridgeCli.merge_settings(conf_file)
 
         # Override settings from command line arguments
         self.override_config()
 
-        logging.debug("Settings in use: {}".format(json.dumps(TaskBridgeCli.SETTINGS, indent=2)))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Settings in use: %s", json.dumps(TaskBridgeCli.SETTINGS, indent=2))
 
     @staticmethod
     def merge_settings(conf_file: str) -> None:
@@ -312,18 +345,16 @@ class TaskBridgeCli:
         if os.path.exists(conf_file):
             with open(conf_file) as fp:
                 try:
-                    content = fp.read()
-                    loaded_settings = json.loads(content)
-                    for key, value in TaskBridgeCli.SETTINGS.items():
-                        if key in loaded_settings.keys():
-                            if key == "associations":
-                                for sync_dir in ['bi_directional', 'local_to_remote', 'remote_to_local']:
-                                    if sync_dir in loaded_settings[key]:
-                                        TaskBridgeCli.SETTINGS[key][sync_dir] = loaded_settings[key][sync_dir]
-                            else:
-                                TaskBridgeCli.SETTINGS[key] = loaded_settings[key]
+                    loaded_settings = json.load(fp)
+                    for key in TaskBridgeCli.SETTINGS.keys() & loaded_settings.keys():
+                        if key == "associations":
+                            associations = TaskBridgeCli.SETTINGS[key]
+                            associations.update({sync_dir: loaded_settings[key][sync_dir]
+                                                 for sync_dir in associations.keys() & loaded_settings[key].keys()})
+                        else:
+                            TaskBridgeCli.SETTINGS[key] = loaded_settings[key]
                 except json.decoder.JSONDecodeError:
-                    logging.critical("Your configuration file at {} is invalid. Please check syntax.".format(conf_file))
+                    logging.critical("Your configuration file at %s is invalid. Please check syntax.", conf_file)
                     sys.exit(20)
 
     def override_config(self) -> None:
@@ -332,23 +363,32 @@ class TaskBridgeCli:
         """
 
         vargs = vars(self.args)
-        for key, value in TaskBridgeCli.SETTINGS.items():
-            if key in self.args:
-                if key == 'reminder_sync' and self.args.reminder_sync:
-                    TaskBridgeCli.SETTINGS[key] = list(csv.reader(self.args.reminder_sync))
-                elif key == 'associations':
-                    if self.args.notes_bi_directional:
-                        TaskBridgeCli.SETTINGS[key]['bi_directional'] = list(csv.reader(self.args.notes_bi_directional))
-                    if self.args.notes_local_remote:
-                        TaskBridgeCli.SETTINGS[key]['local_to_remote'] = list(csv.reader(self.args.notes_local_remote))
-                    if self.args.notes_remote_local:
-                        TaskBridgeCli.SETTINGS[key]['remote_to_local'] = list(csv.reader(self.args.notes_remote_local))
-                else:
-                    TaskBridgeCli.SETTINGS[key] = vargs[key]
+        for key in (TaskBridgeCli.SETTINGS.keys() - {'reminder_sync', 'associations'}) & vargs.keys():
+            TaskBridgeCli.SETTINGS[key] = vargs[key]
+
+        if vargs.get('reminder_sync'):
+            TaskBridgeCli.SETTINGS['reminder_sync'] = TaskBridgeCli._parse_list_option(vargs['reminder_sync'])
+        associations = TaskBridgeCli.SETTINGS['associations']
+        for sync_dir, option in [('bi_directional', 'notes_bi_directional'),
+                                 ('local_to_remote', 'notes_local_remote'),
+                                 ('remote_to_local', 'notes_remote_local')]:
+            if vargs.get(option):
+                associations[sync_dir] = TaskBridgeCli._parse_list_option(vargs[option])
+
+    @staticmethod
+    def _parse_list_option(value: str) -> List[str]:
+        """
+        Parse a comma-separated command-line option, such as a list of folder names. Names containing commas can be quoted.
+
+        :param value: the value given on the command line.
+        :return: the list of names.
+        """
+        return next(csv.reader([value], skipinitialspace=True), [])
 
     def setup_logging(self) -> logging.Logger:
         """
-        Sets up the logging system.
+        Sets up the logging system. Writes to the log file are handed to a background listener, so the notes and reminders
+        sync threads do not wait on disk I/O or on each other for the file lock.
 
         :return: the logging helper for the CLI.
         """
@@ -360,24 +400,22 @@ class TaskBridgeCli:
                 print("Specified log directory {} is not accessible.".format(self.args.log_dir))
                 sys.exit(1)
         else:
-            log_folder = Path.home() / "Library" / "Logs" / "TaskBridge"
+            log_folder = helpers.LOG_LOCATION
         log_folder.mkdir(parents=True, exist_ok=True)
 
         log_file = datetime.now().strftime("TaskBridge_%Y%m%d-%H%M%S") + '.log'
-        log_levels = {
-            'debug': logging.DEBUG,
-            'info': logging.INFO,
-            'warning': logging.WARNING,
-            'critical': logging.CRITICAL
-        }
-        log_level = log_levels[self.args.log_level]
+        log_level = helpers.LOG_LEVELS[self.args.log_level]
 
         logging.basicConfig(
             level=log_level,
             format='%(asctime)s %(levelname)s: %(message)s',
         )
         if log_file:
-            logging.getLogger().addHandler(logging.FileHandler(log_folder / log_file))
+            log_queue = queue.SimpleQueue()
+            self.log_listener = QueueListener(log_queue, logging.FileHandler(log_folder / log_file))
+            self.log_listener.start()
+            atexit.register(self.log_listener.stop)
+            logging.getLogger().addHandler(QueueHandler(log_queue))
         return logging.getLogger()
 
 
@@ -470,7 +508,7 @@ def main():
     parser.add_argument(
         "--log-level",
         type=str,
-        choices=['debug', 'info', 'critical', 'warning'],
+        choices=helpers.LOG_LEVELS.keys(),
         default='info',
         help="specify the logging level.")
 
@@ -4,7 +4,7 @@ Contains the ``NoteCheckbox`` class.
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Tuple
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QTableWidgetItem
@@ -24,6 +24,8 @@ class NoteCheckBox(QTableWidgetItem):
     CHECK_TYPES = ['local_to_remote', 'remote_to_local', 'bi_directional']
     #: List of checkboxes in the notes table
     CB_LIST: List[NoteCheckBox] = []
+    #: Checkboxes in the notes table, indexed by location, folder name and check type
+    CB_INDEX: Dict[Tuple[str, str, str], NoteCheckBox] = {}
 
     def __init__(self, check_type: str, location: str, folder_name: str, associations: dict, *args, **kwargs):
         """
@@ -32,7 +34,8 @@ class NoteCheckBox(QTableWidgetItem):
         :param check_type: the type of checkbox from :py:att``CHECK_TYPES`` above.
         :param location: whether this checkbox represents a 'local' or 'remote' folder.
         :param folder_name: the name of the folder this checkbox represents.
-        :param associations: a dictionary of folder associations as chosen by the user.
+        :param associations: a dictionary of folder associations as chosen by the user, mapping each check type to the
+        folder names with that association. Sets are preferred, since the table checks each folder against them.
         """
         super().__init__(*args, **kwargs)
         self.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
@@ -42,6 +45,7 @@ class NoteCheckBox(QTableWidgetItem):
         self.associations: dict = associations
         self.load_check_state()
         NoteCheckBox.CB_LIST.append(self)
+        NoteCheckBox.CB_INDEX[(location, folder_name, check_type)] = self
 
     @staticmethod
     def reset_list() -> None:
@@ -49,6 +53,7 @@ class NoteCheckBox(QTableWidgetItem):
         Remove all stored checkboxes.
         """
         NoteCheckBox.CB_LIST.clear()
+        NoteCheckBox.CB_INDEX.clear()
 
     def load_check_state(self) -> None:
         """
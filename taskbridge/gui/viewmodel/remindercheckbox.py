@@ -4,7 +4,7 @@ Contains the ``ReminderCheckbox`` class.
 
 from __future__ import annotations
 
-from typing import List
+from typing import Collection, List
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QTableWidgetItem
@@ -16,16 +16,16 @@ class ReminderCheckbox(QTableWidgetItem):
     """
     CB_LIST: List[ReminderCheckbox] = []
 
-    def __init__(self, container_name: str, to_sync: List[str], *args, **kwargs):
+    def __init__(self, container_name: str, to_sync: Collection[str], *args, **kwargs):
         """
         Initialises the reminder checkbox.
 
         :param container_name: the name of the container this checkbox represents.
-        :param to_sync: a list of which reminder containers should be synchronised.
+        :param to_sync: the names of the reminder containers which should be synchronised.
         """
         super().__init__(*args, **kwargs)
         self.container_name: str = container_name
-        self.to_sync: List[str] = to_sync
+        self.to_sync: Collection[str] = to_sync
         self.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
         self.load_check_state()
         ReminderCheckbox.CB_LIST.append(self)
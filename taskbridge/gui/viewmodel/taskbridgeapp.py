@@ -4,6 +4,7 @@ Contains the main view controller for the main window of the app.
 
 from __future__ import annotations
 
+import copy
 import datetime
 import json
 import os.path
@@ -32,6 +33,8 @@ from taskbridge.gui.viewmodel.mainwindow import MainWindow
 from taskbridge.gui.viewmodel.notecheckbox import NoteCheckBox
 from taskbridge.gui.viewmodel.remindercheckbox import ReminderCheckbox
 
+_URL_RE = re.compile(r'https?://(?:www\.)?[a-zA-Z0-9./]+')  #: Validates the CalDav server address and task path.
+
 
 class TaskBridgeApp(QMainWindow):
     """
@@ -81,6 +84,8 @@ class TaskBridgeApp(QMainWindow):
 
     #: If True, there are unsaved changes.
     PENDING_CHANGES: bool = False
+    #: Settings as last loaded from or saved to file, used to discard unsaved changes.
+    SAVED_SETTINGS: dict | None = None
 
     def __init__(self, assets_path: str):
         """
@@ -97,6 +102,7 @@ class TaskBridgeApp(QMainWindow):
         self.sync_worker = None
         self.tray_icon = None
         self.assets_path: str = assets_path
+        self.table_icons: dict[str, QIcon] = {}
         TaskBridgeApp.bootstrap_settings()
         QtCore.QDir.addSearchPath('assets', assets_path)
         self.note_boxes: List = []
@@ -124,20 +130,32 @@ class TaskBridgeApp(QMainWindow):
         Create configuration file if it doesn't exist.
         """
         conf_file = helpers.settings_folder() / 'conf.json'
-        if not os.path.exists(conf_file):
-            with open(helpers.settings_folder() / 'conf.json', 'w') as fp:
-                json.dump(TaskBridgeApp.SETTINGS, fp)
+        if not conf_file.exists():
+            with helpers.atomic_open(conf_file) as fp:
+                fp.write(json.dumps(TaskBridgeApp.SETTINGS))
 
     @staticmethod
     def load_settings() -> None:
         """
         Load settings from configuration file.
         """
-        conf_file = helpers.settings_folder() / 'conf.json'
-        if not os.path.exists(conf_file):
+        try:
+            content = (helpers.settings_folder() / 'conf.json').read_bytes()
+        except FileNotFoundError:
             return
-        with open(helpers.settings_folder() / 'conf.json') as fp:
-            TaskBridgeApp.SETTINGS = json.load(fp)
+        TaskBridgeApp.SETTINGS = json.loads(content)
+        TaskBridgeApp.SAVED_SETTINGS = copy.deepcopy(TaskBridgeApp.SETTINGS)
+
+    @staticmethod
+    def discard_settings() -> None:
+        """
+        Discard unsaved changes by restoring the settings as they were last loaded or saved, without re-reading the
+        configuration file.
+        """
+        if TaskBridgeApp.SAVED_SETTINGS is None:
+            TaskBridgeApp.load_settings()
+            return
+        TaskBridgeApp.SETTINGS = copy.deepcopy(TaskBridgeApp.SAVED_SETTINGS)
 
     @staticmethod
     def _show_message(title: str, message: str, message_type: str = 'info') -> None:
@@ -193,18 +211,44 @@ class TaskBridgeApp(QMainWindow):
         dialog.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
         dialog.exec()
 
-    def get_table_icon(self, image: str) -> str:
+    @staticmethod
+    def get_table_icon_colour() -> str:
+        """
+        Gets the colour of table icons which suits the current appearance, i.e. white icons when dark mode is set.
+
+        :return: 'white' or 'black'.
+        """
+        return 'white' if darkdetect.isDark() else 'black'
+
+    def get_table_icon(self, image: str, colour: str | None = None) -> str:
         """
         Gets an icon for inline-display in table. Returns correct icon depending on whether dark mode is set.
 
         :param image: the name of the image to display from the 'taskbridge/gui/assets/table' folder.
+        :param colour: the icon colour from :py:meth:`get_table_icon_colour`, looked up if not given.
 
         :return: path to the correct image.
         """
-        colour = 'white' if darkdetect.isDark() else 'black'
+        if colour is None:
+            colour = TaskBridgeApp.get_table_icon_colour()
         image_path = self.assets_path + '/table/{0}_{1}.png'.format(image, colour)
         return image_path
 
+    def get_table_qicon(self, image: str, colour: str | None = None) -> QIcon:
+        """
+        Gets an icon for inline-display in table as a :py:class:`QIcon`. Icons are only loaded once, then shared by every
+        row which displays them.
+
+        :param image: the name of the image to display from the 'taskbridge/gui/assets/table' folder.
+        :param colour: the icon colour from :py:meth:`get_table_icon_colour`, looked up if not given.
+
+        :return: the icon.
+        """
+        image_path = self.get_table_icon(image, colour)
+        if image_path not in self.table_icons:
+            self.table_icons[image_path] = QIcon(image_path)
+        return self.table_icons[image_path]
+
     def save_settings(self, what: str | None = None, silent: bool = True) -> None:
         """
         Save settings to file.
@@ -221,8 +265,9 @@ class TaskBridgeApp(QMainWindow):
                 self.ui.cb_reminder_autoprune.setChecked(True)
                 TaskBridgeApp.SETTINGS['prune_reminders'] = '1'
 
-        with open(helpers.settings_folder() / 'conf.json', 'w') as fp:
-            json.dump(TaskBridgeApp.SETTINGS, fp)
+        with helpers.atomic_open(helpers.settings_folder() / 'conf.json') as fp:
+            fp.write(json.dumps(TaskBridgeApp.SETTINGS))
+        TaskBridgeApp.SAVED_SETTINGS = copy.deepcopy(TaskBridgeApp.SETTINGS)
         if not silent:
             TaskBridgeApp._show_message("Settings Saved", "Your {} sync settings have been saved.".format(what))
         TaskBridgeApp.PENDING_CHANGES = False
@@ -348,7 +393,7 @@ class TaskBridgeApp(QMainWindow):
         elif action == QMessageBox.StandardButton.Discard:
             self.ui.frm_notes.setEnabled(False)
             self.ui.frm_reminders.setEnabled(False)
-            self.load_settings()
+            TaskBridgeApp.discard_settings()
             self.refresh_reminders()
             self.refresh_notes()
             TaskBridgeApp.PENDING_CHANGES = False
@@ -443,13 +488,14 @@ class TaskBridgeApp(QMainWindow):
         self.ui.tbl_notes.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.ui.tbl_notes.setHorizontalHeaderItem(0, QTableWidgetItem('Folder'))
         self.ui.tbl_notes.setHorizontalHeaderItem(1, QTableWidgetItem('Location'))
-        icon = QIcon(QtGui.QPixmap(self.get_table_icon('local_to_remote')))
+        colour = TaskBridgeApp.get_table_icon_colour()
+        icon = self.get_table_qicon('local_to_remote', colour)
         self.ui.tbl_notes.setHorizontalHeaderItem(2, QTableWidgetItem(icon, None, QTableWidgetItem.ItemType.UserType))
         self.ui.tbl_notes.horizontalHeaderItem(2).setToolTip('Sync local notes to remote')
-        icon = QIcon(QtGui.QPixmap(self.get_table_icon('remote_to_local')))
+        icon = self.get_table_qicon('remote_to_local', colour)
         self.ui.tbl_notes.setHorizontalHeaderItem(3, QTableWidgetItem(icon, None, QTableWidgetItem.ItemType.UserType))
         self.ui.tbl_notes.horizontalHeaderItem(3).setToolTip('Sync remote notes to local')
-        icon = QIcon(QtGui.QPixmap(self.get_table_icon('bidirectional')))
+        icon = self.get_table_qicon('bidirectional', colour)
         self.ui.tbl_notes.setHorizontalHeaderItem(4, QTableWidgetItem(icon, None, QTableWidgetItem.ItemType.UserType))
         self.ui.tbl_notes.horizontalHeaderItem(4).setToolTip('Bi-directional sync')
         self.ui.tbl_notes.setIconSize(QSize(56, 56))
@@ -512,30 +558,33 @@ class TaskBridgeApp(QMainWindow):
             self.ui.lbl_sync_status.setText("Currently Idle.")
             self.ui.btn_sync.setEnabled(True)
 
-        # Display folders in table
+        # Display folders in table, repainting once when done
+        self.ui.tbl_notes.setUpdatesEnabled(False)
         self.ui.tbl_notes.setRowCount(0)
-        NoteCheckBox.CB_LIST.clear()
-        row = 0
         NoteCheckBox.reset_list()
+        assoc = {direction: frozenset(folders) for direction, folders in TaskBridgeApp.SETTINGS['associations'].items()}
+        colour = TaskBridgeApp.get_table_icon_colour()
+        rows = []
         for folder in folder_list:
             if folder.local_folder is not None and folder.remote_folder is None:
                 name = folder.local_folder.name
                 location = 'Local'
-                location_icon = QIcon(self.get_table_icon('local'))
+                location_icon = self.get_table_qicon('local', colour)
             elif folder.local_folder is None and folder.remote_folder is not None:
                 name = folder.remote_folder.name
                 location = 'Remote'
-                location_icon = QIcon(self.get_table_icon('remote'))
+                location_icon = self.get_table_qicon('remote', colour)
             elif folder.local_folder is not None and folder.remote_folder is not None:
                 name = folder.local_folder.name
                 location = 'Local & Remote'
-                location_icon = QIcon(self.get_table_icon('local_and_remote'))
+                location_icon = self.get_table_qicon('local_and_remote', colour)
             else:
                 self.display_log("Warning: One of your notes folders could not be found locally or remotely.")
                 continue
+            rows.append((name, location, location_icon))
 
-            assoc = TaskBridgeApp.SETTINGS['associations']
-            self.ui.tbl_notes.insertRow(row)
+        self.ui.tbl_notes.setRowCount(len(rows))
+        for row, (name, location, location_icon) in enumerate(rows):
             self.ui.tbl_notes.setItem(row, 0, QTableWidgetItem(name))
             self.ui.tbl_notes.setItem(row, 1, QTableWidgetItem(location_icon, None, QTableWidgetItem.ItemType.UserType))
             self.ui.tbl_notes.setItem(row, 2, NoteCheckBox(check_type='local_to_remote', location=location,
@@ -544,23 +593,20 @@ class TaskBridgeApp(QMainWindow):
                                                            folder_name=name, associations=assoc))
             self.ui.tbl_notes.setItem(row, 4, NoteCheckBox(check_type='bi_directional', location=location,
                                                            folder_name=name, associations=assoc))
+        self.ui.tbl_notes.setUpdatesEnabled(True)
 
     def handle_note_checkbox(self, row, col) -> None:
         """
         Handles the UI logic for the checkboxes in the notes folder. Refer to the ``NoteCheckbox`` class.
         """
-        self.ui.tbl_notes.setUpdatesEnabled(False)
         item = self.ui.tbl_notes.item(row, col)
         if not isinstance(item, NoteCheckBox):
             return
+        self.ui.tbl_notes.setUpdatesEnabled(False)
 
         check_group = {item.check_type: item}
         for key in [k for k in NoteCheckBox.CHECK_TYPES if k not in check_group.keys()]:
-            check_group[key] = next((cb for cb in NoteCheckBox.CB_LIST if
-                                     cb.location == item.location and
-                                     cb.folder_name == item.folder_name and
-                                     cb.check_type == key),
-                                    None)
+            check_group[key] = NoteCheckBox.CB_INDEX.get((item.location, item.folder_name, key))
 
         if item.is_checked():
             if item.check_type == 'bi_directional':
@@ -605,7 +651,7 @@ class TaskBridgeApp(QMainWindow):
         action = self._ask_question("Discard Changes?",
                                     "Are you sure you want to discard changes to note synchronisation settings?")
         if action == QMessageBox.StandardButton.Yes:
-            TaskBridgeApp.load_settings()
+            TaskBridgeApp.discard_settings()
             self.apply_notes_settings()
             if TaskBridgeApp.SETTINGS['sync_notes'] == '1':
                 self.load_note_folders()
@@ -667,30 +713,37 @@ class TaskBridgeApp(QMainWindow):
             self.ui.lbl_sync_status.setText("Currently Idle.")
             self.ui.btn_sync.setEnabled(True)
 
-        # Display containers in table
+        # Display containers in table, repainting once when done
+        self.ui.tbl_reminders.setUpdatesEnabled(False)
         self.ui.tbl_reminders.setRowCount(0)
-        row = 0
+        ReminderCheckbox.reset_list()
+        to_sync = frozenset(TaskBridgeApp.SETTINGS['reminder_sync'])
+        colour = TaskBridgeApp.get_table_icon_colour()
+        rows = []
 
         for container in container_list:
             if container.local_list is not None and container.remote_calendar is None:
                 name = container.local_list.name
-                location_icon = QIcon(self.get_table_icon('local'))
+                location_icon = self.get_table_qicon('local', colour)
             elif container.local_list is None and container.remote_calendar is not None:
                 name = container.remote_calendar.name
-                location_icon = QIcon(self.get_table_icon('remote'))
+                location_icon = self.get_table_qicon('remote', colour)
             elif container.local_list is not None and container.remote_calendar is not None:
                 name = container.local_list.name
-                location_icon = QIcon(self.get_table_icon('local_and_remote'))
+                location_icon = self.get_table_qicon('local_and_remote', colour)
             else:
                 self.display_log("Warning: One of your reminder containers could not be found locally or remotely.")
                 continue
+            rows.append((name, location_icon))
 
-            cbox = ReminderCheckbox(name, TaskBridgeApp.SETTINGS['reminder_sync'])
-            self.ui.tbl_reminders.insertRow(row)
+        self.ui.tbl_reminders.setRowCount(len(rows))
+        for row, (name, location_icon) in enumerate(rows):
+            cbox = ReminderCheckbox(name, to_sync)
             self.ui.tbl_reminders.setItem(row, 0, QTableWidgetItem(name))
             self.ui.tbl_reminders.setItem(row, 1,
                                           QTableWidgetItem(location_icon, None, QTableWidgetItem.ItemType.UserType))
             self.ui.tbl_reminders.setItem(row, 2, cbox)
+        self.ui.tbl_reminders.setUpdatesEnabled(True)
 
     def apply_reminders_settings(self) -> None:
         """
@@ -745,13 +798,12 @@ class TaskBridgeApp(QMainWindow):
 
         full_path = ''
         if self.ui.txt_reminder_address.text():
-            url_regex = re.compile(r'https?://(?:www\.)?[a-zA-Z0-9./]+')
             server_address = self.ui.txt_reminder_address.text().strip('/')
             task_path = self.ui.txt_reminder_path.text().strip('/')
             if not task_path.startswith('/'):
                 task_path = '/' + task_path
             full_path = server_address + task_path
-            if not url_regex.match(full_path):
+            if not _URL_RE.match(full_path):
                 error += "Server address or task path are not in the right format.\n"
                 is_valid = False
 
@@ -765,7 +817,7 @@ class TaskBridgeApp(QMainWindow):
         action = self._ask_question("Discard Changes?",
                                     "Are you sure you want to discard changes to reminder synchronisation settings?")
         if action == QMessageBox.StandardButton.Yes:
-            TaskBridgeApp.load_settings()
+            TaskBridgeApp.discard_settings()
             self.apply_reminders_settings()
             self.load_reminder_lists()
 
@@ -4,13 +4,14 @@ Contains classes and functions which are run in a separate thread.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
-from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
 from typing import Callable
 import threading
-import time
 import schedule
 
 from PyQt6.QtCore import QThread, pyqtSignal
@@ -48,31 +49,34 @@ class LoggingThread(QThread):
         self.log_file: bool = log_file
         self.log_gui: bool = log_gui
         self.logger: logging.Logger = logging.getLogger()
+        self.log_listener: QueueListener | None = None
         self.setup_logging()
 
     def setup_logging(self) -> None:
         """
-        Sets up the logging system as configured in the constructor.
+        Sets up the logging system as configured in the constructor. Log file and standard out writes are handed to a
+        background listener, so synchronisation threads do not block on them.
         """
-        log_folder = Path.home() / "Library" / "Logs" / "TaskBridge"
+        log_folder = helpers.LOG_LOCATION
         log_folder.mkdir(parents=True, exist_ok=True)
         log_file = datetime.now().strftime("TaskBridge_%Y%m%d-%H%M%S") + '.log'
-        log_levels = {
-            'debug': logging.DEBUG,
-            'info': logging.INFO,
-            'warning': logging.WARNING,
-            'critical': logging.CRITICAL
-        }
-        log_level = log_levels[self.logging_level]
+        log_level = helpers.LOG_LEVELS[self.logging_level]
 
         logging.basicConfig(
             level=log_level,
             format='%(asctime)s %(levelname)s: %(message)s',
         )
+        handlers = []
         if self.log_file:
-            logging.getLogger().addHandler(logging.FileHandler(log_folder / log_file))
+            handlers.append(logging.FileHandler(log_folder / log_file))
         if self.log_stdout:
-            logging.getLogger().addHandler(logging.StreamHandler(sys.stdout))
+            handlers.append(logging.StreamHandler(sys.stdout))
+        if handlers:
+            log_queue = queue.SimpleQueue()
+            self.log_listener = QueueListener(log_queue, *handlers)
+            self.log_listener.start()
+            atexit.register(self.log_listener.stop)
+            logging.getLogger().addHandler(QueueHandler(log_queue))
         if self.log_gui:
             func_handler = helpers.FunctionHandler(lambda msg: self.log_signal.emit(msg))
             logging.getLogger().addHandler(func_handler)
@@ -89,8 +93,7 @@ class LoggingThread(QThread):
         """
         Keeps the logging thread running until it is stopped.
         """
-        while not self.stop_logging.is_set():
-            time.sleep(1)
+        self.stop_logging.wait()
 
 
 # noinspection PyUnresolvedReferences
@@ -326,9 +329,10 @@ class Sync(QThread):
 
 def run_continuously(interval=1) -> threading.Event():
     """
-    Utility function which continuously calls ``schedule`` to run any pending tasks.
+    Utility function which continuously calls ``schedule`` to run any pending tasks. Between runs, the thread sleeps
+    until the next task is due rather than polling.
 
-    :param interval: interval between cycles.
+    :param interval: interval between cycles when no task is scheduled.
 
     :return: a threading event which can be used to stop the continuous run.
     """
@@ -347,7 +351,9 @@ def run_continuously(interval=1) -> threading.Event():
             """
             while not cease_continuous_run.is_set():
                 schedule.run_pending()
-                time.sleep(interval)
+                idle_seconds = schedule.idle_seconds()
+                # Waiting on the event rather than sleeping lets the thread stop as soon as it is cancelled
+                cease_continuous_run.wait(interval if idle_seconds is None else max(idle_seconds, 0))
 
     continuous_thread = ScheduleThread()
     continuous_thread.start()
@@ -4,23 +4,47 @@ This is a helper file for both note and reminder synchronisation.
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
+import os
 import re
 import sys
+import tempfile
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from subprocess import Popen, PIPE
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Iterator, IO
 
-from caldav import Principal
-import markdown2
-from markdownify import markdownify as md
+if TYPE_CHECKING:
+    from caldav import Principal
+    from markdownify import MarkdownConverter
 
 DATA_LOCATION: Path = Path.home() / "Library" / "Application Support" / "TaskBridge"  #: Location where application data is
 # stored.
+LOG_LOCATION: Path = Path.home() / "Library" / "Logs" / "TaskBridge"  #: Location where log files are written.
+LOG_LEVELS: dict[str, int] = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'critical': logging.CRITICAL
+}  #: Logging levels which can be chosen by the user.
 DRY_RUN: bool = False  #: If set to true, the user will have to confirm any change made by TaskBridge.
+DB_TIMEOUT: float = 30.0  #: Seconds to wait for another connection to release the SQLite database, since notes and
+# reminders may be synchronised at the same time.
 CALDAV_PRINCIPAL: Principal | None = None
+_CREATED_FOLDERS: set = set()  #: Folders already created by ``_ensure_folder`` during this run.
+_BLANK_LINE_RE = re.compile(r'^\s*$')  #: Matches lines of converted HTML that contain only whitespace.
+_FIXED_WIDTH_DATE_RES = {
+    "%Y%m%dT%H%M%S": re.compile(r'(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})', re.ASCII),
+    "%Y%m%d": re.compile(r'(\d{4})(\d{2})(\d{2})', re.ASCII),
+    "%Y-%m-%d %H:%M:%S": re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})', re.ASCII)
+}  #: Patterns for the fixed-width formats in ``DateUtil`` which can be parsed without ``strptime``.
+_MARKDOWN_EXTRAS = {
+    'breaks': {'on_newline': True, 'on_backslash': True},
+    'cuddled-lists': None
+}  #: Extras used when converting Markdown to HTML.
 
 
 def confirm(prompt: str) -> bool:
@@ -65,6 +89,18 @@ def get_uuid() -> str:
     return str(uuid.uuid4())
 
 
+@functools.lru_cache(maxsize=None)
+def _html_to_markdown_converter() -> MarkdownConverter:
+    """
+    Get the shared HTML to Markdown converter. Markdownify (and BeautifulSoup with it) is only imported the first time a
+    note is converted, keeping it out of start-up when notes are not being synchronised.
+
+    :return: the shared converter.
+    """
+    from markdownify import MarkdownConverter
+    return MarkdownConverter(heading_style='ATX', newline_style='SPACES')
+
+
 def html_to_markdown(html: str) -> str:
     """
     Converts HTML to Markdown using the `Markdownify <https://pypi.org/project/markdownify/>`_ library.
@@ -73,30 +109,37 @@ def html_to_markdown(html: str) -> str:
 
     :return: the Markdown version of the HTML given.
     """
-    mdown = md(html.replace('<ul', '<br><ul'),
-               heading_style='ATX',
-               newline_style='SPACES')
-    mdown = mdown.replace('\n', '  \n')
-    return mdown
+    if '<ul' in html:
+        html = html.replace('<ul', '<br><ul')
+    return _html_to_markdown_converter().convert(html).replace('\n', '  \n')
 
 
+@functools.lru_cache(maxsize=256)
 def markdown_to_html(text: str) -> str:
     """
-    Converts Markdown to HTML using the `markdown2 <https://pypi.org/project/markdown2/>`_ library.
+    Converts Markdown to HTML using the `markdown2 <https://pypi.org/project/markdown2/>`_ library. Results are cached,
+    since unchanged notes are converted again on every sync.
 
     :param text: the Markdown text to convert to HTMl.
 
     :return: the HTML version of the Markdown given.
     """
-    html = markdown2.markdown(text, extras={
-        'breaks': {'on_newline': True, 'on_backslash': True},
-        'cuddled-lists': None
-    })
-    build = ''
-    for line in html.split('\n'):
-        build += '<br>' if re.match(r'^\s*$', line) else line
-        build += '\n'
-    return build
+    import markdown2
+    html = markdown2.markdown(text, extras=_MARKDOWN_EXTRAS)
+    return ''.join('<br>\n' if _BLANK_LINE_RE.match(line) else line + '\n' for line in html.split('\n'))
+
+
+def _ensure_folder(folder: Path) -> Path:
+    """
+    Create a folder, including its parents, unless it has already been created during this run.
+
+    :param folder: the folder to create.
+    :return: the folder.
+    """
+    if folder not in _CREATED_FOLDERS:
+        folder.mkdir(parents=True, exist_ok=True)
+        _CREATED_FOLDERS.add(folder)
+    return folder
 
 
 def db_folder() -> Path:
@@ -105,8 +148,7 @@ def db_folder() -> Path:
 
     :return: path to the SQLite database file.
     """
-    DATA_LOCATION.mkdir(parents=True, exist_ok=True)
-    return DATA_LOCATION / "TaskBridge.db"
+    return _ensure_folder(DATA_LOCATION) / "TaskBridge.db"
 
 
 def temp_folder() -> Path:
@@ -115,9 +157,29 @@ def temp_folder() -> Path:
 
     :return: path to the ``tmp`` folder.
     """
-    tmp_folder = DATA_LOCATION / 'tmp/'
-    tmp_folder.mkdir(parents=True, exist_ok=True)
-    return tmp_folder
+    return _ensure_folder(DATA_LOCATION / 'tmp/')
+
+
+@contextlib.contextmanager
+def atomic_open(path: Path) -> Iterator[IO[str]]:
+    """
+    Open a temporary text file next to ``path`` for writing. Once the block completes successfully, the file replaces
+    ``path`` in a single rename, so an interrupted write never leaves a truncated file behind.
+
+    :param path: the file to write.
+    :return: the temporary file, open for writing.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix='.{}.'.format(path.name), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as fp:
+            yield fp
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
 
 
 def settings_folder() -> Path:
@@ -126,9 +188,7 @@ def settings_folder() -> Path:
 
     :return: path to the Application Data folder.
     """
-    folder = DATA_LOCATION
-    folder.mkdir(parents=True, exist_ok=True)
-    return folder
+    return _ensure_folder(DATA_LOCATION)
 
 
 class DateUtil:
@@ -156,14 +216,9 @@ class DateUtil:
 
         """
         if isinstance(obj, str):
-            try:
-                return datetime.strptime(obj, source_format)
-            except ValueError:
-                if source_format == DateUtil.APPLE_DATETIME:
-                    try:
-                        return datetime.strptime(obj, DateUtil.APPLE_DATETIME_ALT)
-                    except ValueError:
-                        return False
+            parsed = DateUtil._parse_string(source_format, obj)
+            if parsed is not None:
+                return parsed
         if required_format == '':
             return obj
         else:
@@ -173,6 +228,64 @@ class DateUtil:
                 print('Could not convert date to specified format {}'.format(required_format), file=sys.stderr)
                 return False
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_string(source_format: str, obj: str) -> datetime | bool | None:
+        """
+        Parse a date/datetime string, trying the fixed-width formats before :py:meth:`datetime.strptime`. Results are
+        cached, since the same dates are parsed many times during a sync. Only parsing is cached: formatting a
+        :py:class:`datetime` is cheap, and caching it would conflate aware datetimes that represent the same instant in
+        different timezones.
+
+        :param source_format: the format of ``obj``.
+        :param obj: the string to parse.
+        :return: the parsed :py:class:`datetime`, False if an Apple date/time could not be parsed, or None if ``obj``
+        does not match ``source_format``.
+        """
+        parsed = DateUtil._parse_fixed_width(source_format, obj)
+        if parsed is not None:
+            return parsed
+        try:
+            return datetime.strptime(obj, source_format)
+        except ValueError:
+            if source_format == DateUtil.APPLE_DATETIME:
+                try:
+                    return datetime.strptime(obj, DateUtil.APPLE_DATETIME_ALT)
+                except ValueError:
+                    return False
+        return None
+
+    @staticmethod
+    def _parse_fixed_width(source_format: str, obj: str) -> datetime | None:
+        """
+        Parse the fixed-width, all-numeric CalDav and SQLite formats with a precompiled pattern, which is much cheaper
+        than :py:meth:`datetime.strptime`.
+
+        :param source_format: the format of ``obj``.
+        :param obj: the string to parse.
+        :return: the parsed :py:class:`datetime`, or None if ``obj`` should be parsed with ``strptime`` instead.
+        """
+        pattern = _FIXED_WIDTH_DATE_RES.get(source_format)
+        match = pattern.fullmatch(obj) if pattern is not None else None
+        if match is None:
+            return None
+        try:
+            return datetime(*map(int, match.groups()))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def is_midnight(obj: datetime | date) -> bool:
+        """
+        Check whether a date/datetime has no time component, i.e. it is at exactly 00:00:00.
+
+        :param obj: the date or datetime to check. A :py:class:`date` is always considered to be at midnight.
+        :return: True if ``obj`` is at midnight.
+        """
+        if isinstance(obj, datetime):
+            return obj.hour == 0 and obj.minute == 0 and obj.second == 0
+        return obj.strftime("%H:%M:%S") == "00:00:00"
+
 
 class FunctionHandler(logging.Handler):
     def __init__(self, func: Callable):
@@ -116,8 +116,8 @@ class NoteController:
             error = 'Failed to associate folders {}'.format(data)
             logging.critical(error)
             return False, error
-        debug_msg = 'Folder Associations: {}'.format([str(folder) for folder in NoteFolder.FOLDER_LIST])
-        logging.debug(debug_msg)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('Folder Associations: %s', [str(folder) for folder in NoteFolder.FOLDER_LIST])
         return True, NoteFolder.FOLDER_LIST
 
     @staticmethod
@@ -168,21 +168,47 @@ class NoteController:
             above.
 
         """
-        data = None
-        for folder in NoteFolder.FOLDER_LIST:
-            success, data = folder.sync_notes()
-            if not success:
-                error = 'Failed to sync notes {}'.format(data)
-                logging.critical(error)
-                return False, error
+        data = {
+            'remote_added': [],
+            'remote_updated': [],
+            'local_added': [],
+            'local_updated': []
+        }
+        # Folders are synchronised one at a time: notes are staged through shared temporary files, and each folder's sync
+        # rewrites the whole tb_note table.
+        success, error = NoteController._collect_sync_results(
+            (folder.sync_notes() for folder in NoteFolder.FOLDER_LIST), data)
+        if not success:
+            logging.critical(error)
+            return False, error
 
-        debug_msg = (
-            "Notes synchronisation:: Remote Added: {} | Remote Updated: {} | Local Added: {} | Local Updated: {"
-            "}").format(
-            ','.join(data['remote_added'] if 'remote_added' in data else ['No remote notes added']),
-            ','.join(data['remote_updated'] if 'remote_updated' in data else ['No remote notes updated']),
-            ','.join(data['local_added'] if 'local_added' in data else ['No local notes added']),
-            ','.join(data['local_updated'] if 'local_updated' in data else ['No local notes updated'])
-        )
-        logging.debug(debug_msg)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Notes synchronisation:: Remote Added: %s | Remote Updated: %s | Local Added: %s | Local Updated: %s",
+                ','.join(data['remote_added'] if 'remote_added' in data else ['No remote notes added']),
+                ','.join(data['remote_updated'] if 'remote_updated' in data else ['No remote notes updated']),
+                ','.join(data['local_added'] if 'local_added' in data else ['No local notes added']),
+                ','.join(data['local_updated'] if 'local_updated' in data else ['No local notes updated']))
         return True, data
+
+    @staticmethod
+    def _collect_sync_results(results, data: dict) -> tuple[bool, str]:
+        """
+        Merges the results of each folder's note synchronisation into ``data``, stopping at the first failure.
+
+        :param results: an iterable of ``(success, data)`` tuples as returned by ``NoteFolder.sync_notes``.
+        :param data: dictionary where the lists of changed note names are merged.
+
+        :returns:
+
+            -success (:py:class:`bool`) - true if every folder was successfully synchronised.
+
+            -data (:py:class:`str`) - error message on failure, or success message.
+
+        """
+        for success, folder_data in results:
+            if not success:
+                return False, 'Failed to sync notes {}'.format(folder_data)
+            for key, names in folder_data.items():
+                data.setdefault(key, []).extend(names)
+        return True, 'Notes synchronised'
@@ -6,18 +6,57 @@ represents an attachment within a note.
 from __future__ import annotations
 
 import base64
+import binascii
 import os
 import re
 import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from taskbridge import helpers
 from taskbridge.helpers import DateUtil
 from taskbridge.notes.model import notescript
 
+#: Matches an inline image in a staged note, capturing its ``src`` attribute.
+_LOCAL_IMAGE_RE = re.compile(r'<div><img .*?src="(.*?)"')
+#: Matches a whole line of Markdown containing a parenthesised link target, capturing the first target on the line.
+_MARKDOWN_LINK_LINE_RE = re.compile(r"^[^(\n]*\((.*?)\).*$", re.MULTILINE)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """
+    Writes ``data`` to ``path`` with unbuffered ``write`` calls (normally just one), truncating any existing file.
+
+    :param path: the file to write.
+    :param data: the bytes to write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_file_if_changed(path: Path, data: bytes) -> None:
+    """
+    Writes ``data`` to ``path`` unless the file already holds exactly ``data``, e.g. when only the local modification
+    date of a note was bumped.
+
+    :param path: the file to write.
+    :param data: the bytes to write.
+    """
+    try:
+        with open(path, 'rb') as fp:
+            if fp.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+    _write_file(path, data)
+
 
 class Note:
     """
@@ -71,20 +110,23 @@ class Note:
         created_date = DateUtil.convert(DateUtil.APPLE_DATETIME, c_date.strip())
         modified_date = DateUtil.convert(DateUtil.APPLE_DATETIME, m_date.strip())
 
-        # Attachments
+        # Attachments - listed from the third line until the end marker
         attachments = []
-        attachment_end = staged_lines.index("~~END_ATTACHMENTS~~")
-        for idx in range(2, attachment_end):
-            filename, url = staged_lines[idx].split("~~")
+        for idx in range(2, len(staged_lines)):
+            line = staged_lines[idx]
+            if line == "~~END_ATTACHMENTS~~":
+                attachment_end = idx
+                break
+            filename, url = line.split("~~")
             attachments.append(Attachment(file_name=filename, url=url))
+        else:
+            raise ValueError("~~END_ATTACHMENTS~~ not found in staged content")
 
         parsed_attachments = (
             Attachment.parse_local(attachments, staged_lines, Path(os.path.join(staged_location, '.attachments/'))))
 
         # Body
-        body_html = ""
-        for idx in range(attachment_end + 1, len(staged_lines)):
-            body_html += staged_lines[idx] + "\n"
+        body_html = ''.join(line + "\n" for line in staged_lines[attachment_end + 1:])
         body_markdown = Note.staged_to_markdown(staged_lines, parsed_attachments, attachment_end)
 
         return Note(
@@ -110,15 +152,16 @@ class Note:
 
         # Meta Data
         name = os.path.splitext(remote_file_name)[0]
-        created_date = datetime.fromtimestamp(os.path.getctime(remote_location / remote_file_name))
-        modified_date = datetime.fromtimestamp(os.path.getmtime(remote_location / remote_file_name))
+        remote_stat = os.stat(remote_location / remote_file_name)
+        created_date = datetime.fromtimestamp(remote_stat.st_ctime)
+        modified_date = datetime.fromtimestamp(remote_stat.st_mtime)
 
         # Attachments
         attachments = []
-        for idx in range(len(remote_lines)):
-            line = remote_lines[idx]
-            pattern = r"\(([^)]+\.(?:{}))\)".format(Attachment.get_supported_image_types_string())
-            match = re.search(pattern, line)
+        for line in remote_lines:
+            if '(' not in line:
+                continue
+            match = Attachment._REMOTE_IMAGE_RE.search(line)
             if match:
                 image_filename = match.group(1)
                 image_path = os.path.join(remote_location, image_filename)
@@ -131,9 +174,7 @@ class Note:
         parsed_attachments = Attachment.parse_remote(attachments)
 
         # Body
-        body_markdown = ""
-        for idx in range(len(remote_lines)):
-            body_markdown += remote_lines[idx] + "\n"
+        body_markdown = ''.join(line + "\n" for line in remote_lines)
         body_html = Note.markdown_to_html(remote_lines, parsed_attachments)
 
         return Note(
@@ -154,19 +195,19 @@ class Note:
         :param attachment_end: the index of the line containing ``~~END ATTACHMENTS~~`` in the staged content.
         :return: a Markdown representation of the note's content.
         """
-        md = ""
+        md_lines = []
         image_list = [attachment for attachment in attachments if attachment.file_type == Attachment.TYPE_IMAGE]
         image_index = 0
         for idx in range(attachment_end + 1, len(staged_lines)):
             line = staged_lines[idx]
-            if line.startswith("<div><img "):
+            if _LOCAL_IMAGE_RE.match(line) is not None:
                 try:
                     line = "![{filename}](.attachments/{filename})".format(filename=image_list[image_index].uuid)
                 except IndexError:
                     print('Error parsing images of note.', file=sys.stderr)
                 image_index += 1
-            md += line + "\n"
-        return helpers.html_to_markdown(md)
+            md_lines.append(line + "\n")
+        return helpers.html_to_markdown(''.join(md_lines))
 
     @staticmethod
     def markdown_to_html(remote_lines: List[str], attachments: List[Attachment]) -> str:
@@ -177,23 +218,23 @@ class Note:
         :param attachments: A list of Attachment associated with this note.
         :return: an HTML representation of this note's content.
         """
-        html = ""
-        remote_lines.pop(0)  # First line is note name
+        body_lines = remote_lines[1:]  # First line is note name
+        markdown = "\n".join(body_lines) + "\n" if body_lines else ""
         image_list = [attachment for attachment in attachments if
                       attachment and attachment.file_type == Attachment.TYPE_IMAGE]
         image_index = 0
-        for idx in range(len(remote_lines)):
-            line = remote_lines[idx]
-            match = re.search(r"\(.*?\)", line)
-            if match:
-                f_ext = os.path.splitext(match.group()[1:-1])[1]
-                if f_ext in Attachment.get_supported_image_types():
-                    image_path = "file://" + image_list[image_index].url
-                    line = '<div><img style="max-width: 100%; max-height: 100%;" src="{image_path}"/><br></div>'.format(
-                        image_path=image_path)
-                    remote_lines[idx] = line
-                    image_index += 1
-            html += line + "\n"
+
+        def replace_image(match: re.Match) -> str:
+            nonlocal image_index
+            f_ext = os.path.splitext(match.group(1))[1]
+            if f_ext.lower() not in Attachment._SUPPORTED_IMAGE_TYPES_SET:
+                return match.group()
+            image_path = "file://" + image_list[image_index].url
+            image_index += 1
+            return '<div><img style="max-width: 100%; max-height: 100%;" src="{image_path}"/><br></div>'.format(
+                image_path=image_path)
+
+        html = _MARKDOWN_LINK_LINE_RE.sub(replace_image, markdown)
         return helpers.markdown_to_html(html)
 
     def create_local(self, folder_name: str) -> tuple[bool, str]:
@@ -210,9 +251,7 @@ class Note:
         """
         try:
             temp_file_name = helpers.temp_folder() / (self.name + '.html')
-            with open(temp_file_name, 'w') as fp:
-                fp.write(self.body_html)
-                fp.close()
+            _write_file(temp_file_name, self.body_html.encode('utf-8'))
         except (IOError, OSError) as e:
             return False, 'Failed to export data for local note {0}: {1}'.format(self.name, e)
 
@@ -238,9 +277,7 @@ class Note:
         """
         try:
             temp_file_name = helpers.temp_folder() / (self.name + '.html')
-            with open(temp_file_name, 'w') as fp:
-                fp.write(self.body_html)
-                fp.close()
+            _write_file(temp_file_name, self.body_html.encode('utf-8'))
         except (IOError, OSError) as e:
             return False, 'Failed to export data for local note {0}: {1}'.format(self.name, e)
 
@@ -266,17 +303,18 @@ class Note:
         """
         filename = self.name + '.md'
         try:
-            with open(remote_path / filename, 'w') as fp:
-                fp.write(self.body_markdown)
-                fp.close()
-            os.utime(remote_path / filename, (self.modified_date.timestamp(), self.modified_date.timestamp()))
+            _write_file_if_changed(remote_path / filename, self.body_markdown.encode('utf-8'))
+            modified_timestamp = self.modified_date.timestamp()
+            os.utime(remote_path / filename, (modified_timestamp, modified_timestamp))
         except IOError as e:
             return False, 'Failed to create remote note {0}: {1}'.format(remote_path / filename, e)
 
         # Attachments
-        for attachment in [a for a in self.attachments if a.file_type == Attachment.TYPE_IMAGE]:
-            att_path = remote_path / '.attachments/'
+        images = [a for a in self.attachments if a.file_type == Attachment.TYPE_IMAGE]
+        att_path = remote_path / '.attachments/'
+        if images:
             Path(att_path).mkdir(parents=True, exist_ok=True)
+        for attachment in images:
             attachment.remote_location = att_path / attachment.uuid
             try:
                 shutil.copy2(attachment.url, attachment.remote_location)
@@ -303,6 +341,13 @@ class Attachment:
 
     _SUPPORTED_IMAGE_TYPES = ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.apng',
                               '.avif', '.bmp', '.ico', '.tiff', '.svg']
+    #: Number of Base64 characters decoded at a time when saving an image.
+    _B64_CHUNK_SIZE: int = 1 << 16
+    #: Supported image extensions, for constant-time membership checks.
+    _SUPPORTED_IMAGE_TYPES_SET = frozenset(_SUPPORTED_IMAGE_TYPES)
+    #: Matches an image link in a line of Markdown, capturing the image path.
+    _REMOTE_IMAGE_RE = re.compile(r"\(([^)]+\.(?:{}))\)".format('|'.join(ext[1:] for ext in _SUPPORTED_IMAGE_TYPES)),
+                                  re.IGNORECASE)
 
     def __init__(self, file_type: int = '', file_name: str = '', url: str = '', b64_data: str | None = None,
                  uuid: str = ''):
@@ -325,11 +370,12 @@ class Attachment:
         self.staged_location: Path | None = None
         self.remote_location: Path | None = None
 
-    def save_image_to_file(self, file_path: Path) -> tuple[bool, Path] | tuple[bool, str]:
+    def save_image_to_file(self, file_path: Path, create_folder: bool = True) -> tuple[bool, Path] | tuple[bool, str]:
         """
         Saves a Base64 image attachment to a file.
 
         :param file_path: the path where to save the image *excluding file name*.
+        :param create_folder: if True, ``file_path`` is created if it does not exist.
 
         :returns:
 
@@ -338,17 +384,44 @@ class Attachment:
             -data (:py:class:`str` | :py:class:`Path`) - error message on failure, or path to created image.
 
         """
-        img_data_b64 = self.b64_data.split('base64,')[1].encode()
         staged_path = file_path / self.uuid
+        data_start = self.b64_data.find('base64,')
+        if data_start == -1:
+            return False, 'Attachment {} does not contain Base64 data'.format(self.file_name)
+        data_start += len('base64,')
         try:
-            file_path.mkdir(parents=True, exist_ok=True)
+            if create_folder:
+                file_path.mkdir(parents=True, exist_ok=True)
             with open(staged_path, 'wb') as fp:
-                fp.write(base64.decodebytes(img_data_b64))
+                # Decode in chunks so a large image is never held in memory twice
+                for decoded in Attachment._decode_b64_chunks(self.b64_data, data_start):
+                    fp.write(decoded)
                 self.staged_location = staged_path
                 return True, staged_path
         except OSError:
             return False, 'Could not save remote attachment to {}'.format(staged_path)
 
+    @staticmethod
+    def _decode_b64_chunks(b64_data: str, data_start: int) -> Iterator[bytes]:
+        """
+        Decodes Base64 data in chunks of ``_B64_CHUNK_SIZE`` characters. Whitespace, such as line breaks, is removed from
+        each chunk, and characters left over from a chunk which do not make up a full 4-character group are carried into
+        the next one.
+
+        :param b64_data: the Base64 data.
+        :param data_start: the index in ``b64_data`` where the Base64 data starts.
+        :return: the decoded chunks.
+        """
+        chunk_size = Attachment._B64_CHUNK_SIZE
+        pending = ''
+        for chunk_start in range(data_start, len(b64_data), chunk_size):
+            chunk = pending + ''.join(b64_data[chunk_start:chunk_start + chunk_size].split())
+            usable = len(chunk) - len(chunk) % 4
+            pending = chunk[usable:]
+            yield binascii.a2b_base64(chunk[:usable])
+        if pending:
+            yield binascii.a2b_base64(pending)
+
     def delete_remote(self) -> tuple[bool, str]:
         """
         Deletes the remote file linked to this attachment.
@@ -385,15 +458,23 @@ class Attachment:
         """
         result = []
         image_index = 0
+        local_images = Attachment._get_local_images(staged_lines)
+        dest_created = False
         for attachment in attachments:
             f_name, f_ext = os.path.splitext(attachment.file_name)
-            if f_ext in Attachment._SUPPORTED_IMAGE_TYPES:
+            if f_ext.lower() in Attachment._SUPPORTED_IMAGE_TYPES_SET:
                 attachment.file_type = Attachment.TYPE_IMAGE
-                attachment.b64_data = Attachment._get_local_image(staged_lines, image_index)
+                attachment.b64_data = local_images[image_index] if image_index < len(local_images) else None
                 if attachment.b64_data is None:
                     return False, "Warning, could not find Base64 data for image {}".format(attachment.file_name)
                 attachment.uuid = helpers.get_uuid() + f_ext
-                attachment.save_image_to_file(dest_folder)
+                if not dest_created:
+                    try:
+                        dest_folder.mkdir(parents=True, exist_ok=True)
+                    except OSError:
+                        return False, "Could not create attachment folder {}".format(dest_folder)
+                    dest_created = True
+                attachment.save_image_to_file(dest_folder, create_folder=False)
                 image_index += 1
             elif f_ext == '' and not attachment.url == '':
                 attachment.file_type = Attachment.TYPE_LINK
@@ -415,7 +496,7 @@ class Attachment:
         result = []
         for attachment in attachments:
             f_name, f_ext = os.path.splitext(attachment.file_name)
-            if f_ext in Attachment._SUPPORTED_IMAGE_TYPES:
+            if f_ext.lower() in Attachment._SUPPORTED_IMAGE_TYPES_SET:
                 attachment.b64_data = Attachment._get_remote_image(attachment.url)
                 attachment.uuid = helpers.get_uuid() + f_ext
             result.append(attachment)
@@ -435,13 +516,23 @@ class Attachment:
             -data (None | :py:class:`str`) - nothing on failure, or the ``src`` attribute.
 
         """
-        current_image = 0
+        local_images = Attachment._get_local_images(staged_lines)
+        return local_images[image_index] if image_index < len(local_images) else None
+
+    @staticmethod
+    def _get_local_images(staged_lines: List[str]) -> List[str]:
+        """
+        Given the lines of a staged file, retrieves the ``src`` attribute of every image, in order of appearance.
+
+        :param staged_lines: the lines from a staged file.
+        :return: the list of image ``src`` attributes.
+        """
+        local_images = []
         for line in staged_lines:
-            if line.startswith("<div><img "):
-                if current_image == image_index:
-                    return re.search(r'src="(.*?)"', line).group(1)
-                current_image += 1
-        return None
+            match = _LOCAL_IMAGE_RE.match(line)
+            if match is not None:
+                local_images.append(match.group(1))
+        return local_images
 
     @staticmethod
     def _get_remote_image(url: str) -> str | None:
@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import copy
 import datetime
-import glob
 import os
 import shutil
 import sqlite3
@@ -87,18 +86,18 @@ class NoteFolder:
             return False, stderr
 
         staging_folder_path = stdout.strip()
-        for filename in os.listdir(staging_folder_path):
-            f_name, f_ext = os.path.splitext(filename)
-            if not f_ext == ".staged":
-                continue
-            staged_file = os.path.join(staging_folder_path, filename)
-            with open(staged_file) as fp:
-                staged_content = fp.read()
-            self.local_notes.append(Note.create_from_local(staged_content, Path(staging_folder_path)))
+        staged_files = []
+        with os.scandir(staging_folder_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".staged"):
+                    continue
+                staged_files.append(entry.path)
+                with open(entry.path, 'rb') as fp:
+                    staged_content = fp.read().decode('utf-8')
+                self.local_notes.append(Note.create_from_local(staged_content, Path(staging_folder_path)))
 
-        staged = glob.glob(staging_folder_path + '/*.staged')
-        for s in staged:
-            os.remove(s)
+        for staged_file in staged_files:
+            os.remove(staged_file)
 
         return True, len(self.local_notes)
 
@@ -116,15 +115,13 @@ class NoteFolder:
         """
         self.remote_notes.clear()
 
-        for root, dirs, files in os.walk(self.remote_folder.path):
-            for remote_file in files:
-                f_name, f_ext = os.path.splitext(remote_file)
-                if not f_ext == ".md":
+        with os.scandir(self.remote_folder.path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
                     continue
-                remote_note = self.remote_folder.path / remote_file
-                with open(remote_note) as fp:
-                    remote_content = fp.read()
-                self.remote_notes.append(Note.create_from_remote(remote_content, self.remote_folder.path, remote_file))
+                with open(entry.path, 'rb') as fp:
+                    remote_content = fp.read().decode('utf-8')
+                self.remote_notes.append(Note.create_from_remote(remote_content, self.remote_folder.path, entry.name))
 
         return True, len(self.remote_notes)
 
@@ -202,23 +199,28 @@ class NoteFolder:
         """
         success = True
         data = "Local notes in folder synchronised to remote"
+        push_enabled = self.sync_direction in (NoteFolder.SYNC_LOCAL_TO_REMOTE, NoteFolder.SYNC_BOTH)
+        pull_enabled = self.sync_direction in (NoteFolder.SYNC_REMOTE_TO_LOCAL, NoteFolder.SYNC_BOTH)
+        if not push_enabled and not pull_enabled:
+            return success, data
+
         for local_note in self.local_notes:
             # Get the associated remote note, if any
             remote_note = next((n for n in self.remote_notes
                                 if n.uuid == local_note.uuid or n.name == local_note.name), None)
 
-            if self.sync_direction == NoteFolder.SYNC_LOCAL_TO_REMOTE:
-                # Sync Local --> Remote if remote doesn't exist or is outdated
-                success, data = self.sync_local_note_to_remote(local_note, remote_note, result)
-            elif self.sync_direction == NoteFolder.SYNC_REMOTE_TO_LOCAL:
-                # Sync Local <-- Remote if local is outdated
-                success, data = self.sync_remote_note_to_local(local_note, remote_note, result)
-            elif self.sync_direction == NoteFolder.SYNC_BOTH:
+            if push_enabled and pull_enabled:
                 # Sync Local <--> Remote, depending on which is newer
                 if remote_note is None or local_note.modified_date > remote_note.modified_date:
                     success, data = self.sync_local_note_to_remote(local_note, remote_note, result)
                 elif remote_note.modified_date > local_note.modified_date:
                     success, data = self.sync_remote_note_to_local(local_note, remote_note, result)
+            elif push_enabled:
+                # Sync Local --> Remote if remote doesn't exist or is outdated
+                success, data = self.sync_local_note_to_remote(local_note, remote_note, result)
+            else:
+                # Sync Local <-- Remote if local is outdated
+                success, data = self.sync_remote_note_to_local(local_note, remote_note, result)
             if not success:
                 break
 
@@ -239,12 +241,13 @@ class NoteFolder:
         """
         success = True
         data = "Remote notes in folder synchronised to local"
+        if self.sync_direction not in (NoteFolder.SYNC_REMOTE_TO_LOCAL, NoteFolder.SYNC_BOTH):
+            return success, data
+
         for remote_note in self.remote_notes:
             local_note = next((n for n in self.local_notes
                                if n.uuid == remote_note.modified_date or n.name == remote_note.name), None)
-            if ((
-                    self.sync_direction == NoteFolder.SYNC_REMOTE_TO_LOCAL or self.sync_direction == NoteFolder.SYNC_BOTH)
-                    and local_note is None):
+            if local_note is None:
                 # Local note is missing and so needs to be created
                 key_change = 'local_added'
                 local_note = copy.deepcopy(remote_note)
@@ -339,7 +342,7 @@ class NoteFolder:
         return False, stderr
 
     @staticmethod
-    def load_remote_folders(remote_notes_path: Path) -> tuple[bool, List[RemoteNoteFolder]]:
+    def load_remote_folders(remote_notes_path: Path) -> tuple[bool, str] | tuple[bool, List[RemoteNoteFolder]]:
         """
         Loads the list of remote folders by checking the filesystem.
 
@@ -352,13 +355,34 @@ class NoteFolder:
 
         """
         remote_note_folders = []
-        for root, dirs, files in os.walk(remote_notes_path):
-            for remote_dir in dirs:
-                if not remote_dir.startswith("."):
-                    remote_folder = RemoteNoteFolder(remote_notes_path / remote_dir, remote_dir)
-                    remote_note_folders.append(remote_folder)
+        try:
+            with os.scandir(remote_notes_path) as entries:
+                remote_dirs = [entry.name for entry in entries
+                               if entry.is_dir(follow_symlinks=False) and not entry.name.startswith(".")]
+        except FileNotFoundError:
+            # Nothing has been synchronised to the remote notes folder yet
+            return True, []
+        except OSError as e:
+            return False, repr(e)
+        for remote_dir in remote_dirs:
+            remote_folder = RemoteNoteFolder(remote_notes_path / remote_dir, remote_dir)
+            remote_note_folders.append(remote_folder)
         return True, remote_note_folders
 
+    @staticmethod
+    def _sync_direction_map(associations: dict) -> dict:
+        """
+        Maps each folder name in the associations to its sync direction. A folder listed under several associations
+        takes the first of ``bi_directional``, ``local_to_remote`` and ``remote_to_local``.
+
+        :param associations: list of folder associations.
+        :return: dictionary of folder name to sync direction.
+        """
+        sync_directions = dict.fromkeys(associations['remote_to_local'], NoteFolder.SYNC_REMOTE_TO_LOCAL)
+        sync_directions.update(dict.fromkeys(associations['local_to_remote'], NoteFolder.SYNC_LOCAL_TO_REMOTE))
+        sync_directions.update(dict.fromkeys(associations['bi_directional'], NoteFolder.SYNC_BOTH))
+        return sync_directions
+
     @staticmethod
     def assoc_local_remote(local_folders: List[LocalNoteFolder],
                            remote_folders: List[RemoteNoteFolder],
@@ -373,21 +397,17 @@ class NoteFolder:
         :param associations: list of folder associations.
 
         """
+        bi_directional = frozenset(associations['bi_directional'])
+        local_to_remote = frozenset(associations['local_to_remote'])
+        sync_directions = NoteFolder._sync_direction_map(associations)
         for local_folder in local_folders:
             # Check which local folders need to be synced with remote folders
             remote_folder = next((f for f in remote_folders if f.name == local_folder.name), None)
-            if local_folder.name in associations['bi_directional']:
-                sync_direction = NoteFolder.SYNC_BOTH
-            elif local_folder.name in associations['local_to_remote']:
-                sync_direction = NoteFolder.SYNC_LOCAL_TO_REMOTE
-            elif local_folder.name in associations['remote_to_local']:
-                sync_direction = NoteFolder.SYNC_REMOTE_TO_LOCAL
-            else:
-                sync_direction = NoteFolder.SYNC_NONE
+            sync_direction = sync_directions.get(local_folder.name, NoteFolder.SYNC_NONE)
             NoteFolder(local_folder, remote_folder, sync_direction)
 
             # Create missing remote folder
-            if local_folder.name in associations['bi_directional'] or local_folder.name in associations['local_to_remote']:
+            if local_folder.name in bi_directional or local_folder.name in local_to_remote:
                 if remote_folder is None:
                     remote_folder = RemoteNoteFolder(remote_notes_path / local_folder.name, local_folder.name)
                     if helpers.confirm('Create remote folder {}'.format(remote_folder.name)):
@@ -405,6 +425,9 @@ class NoteFolder:
         :param associations: list of folder associations.
 
         """
+        bi_directional = frozenset(associations['bi_directional'])
+        remote_to_local = frozenset(associations['remote_to_local'])
+        sync_directions = NoteFolder._sync_direction_map(associations)
         for remote_folder in remote_folders:
             # Check if the remote folder is already associated to a local folder
             existing_association = next(
@@ -423,18 +446,11 @@ class NoteFolder:
                 continue
 
             local_folder = next((f for f in local_folders if f.name == remote_folder.name), None)
-            if remote_folder.name in associations['bi_directional']:
-                sync_direction = NoteFolder.SYNC_BOTH
-            elif remote_folder.name in associations['local_to_remote']:
-                sync_direction = NoteFolder.SYNC_LOCAL_TO_REMOTE
-            elif remote_folder.name in associations['remote_to_local']:
-                sync_direction = NoteFolder.SYNC_REMOTE_TO_LOCAL
-            else:
-                sync_direction = NoteFolder.SYNC_NONE
+            sync_direction = sync_directions.get(remote_folder.name, NoteFolder.SYNC_NONE)
             NoteFolder(local_folder, remote_folder, sync_direction)
 
             # Create missing local folder
-            if remote_folder.name in associations['bi_directional'] or remote_folder.name in associations['remote_to_local']:
+            if remote_folder.name in bi_directional or remote_folder.name in remote_to_local:
                 if local_folder is None:
                     local_folder = LocalNoteFolder(remote_folder.name)
                     if helpers.confirm('Create local folder {}'.format(local_folder.name)):
@@ -496,7 +512,7 @@ class NoteFolder:
 
         """
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     sql_create_folder_table = """CREATE TABLE IF NOT EXISTS tb_folder (
@@ -535,9 +551,14 @@ class NoteFolder:
             ))
 
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
+                    # Associations rarely change between syncs, so only rewrite the table when they do
+                    sql_saved_folders = """SELECT local_uuid, local_name, remote_path, remote_name, sync_direction
+                    FROM tb_folder ORDER BY id"""
+                    if [tuple(row) for row in cursor.execute(sql_saved_folders)] == folders:
+                        return True, 'Folders stored in tb_folder'
                     sql_delete_folders = "DELETE FROM tb_folder"
                     cursor.execute(sql_delete_folders)
                     sql_insert_folders = """INSERT INTO tb_folder(local_uuid, local_name, remote_path, remote_name,
@@ -566,12 +587,12 @@ class NoteFolder:
         """
         folder_filter = (NoteFolder.SYNC_BOTH, NoteFolder.SYNC_LOCAL_TO_REMOTE)
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     sql_bi_and_local = "SELECT * FROM tb_folder WHERE sync_direction = ? OR sync_direction = ?"
                     rows = cursor.execute(sql_bi_and_local, folder_filter).fetchall()
-                    current_local_names = [f.name for f in discovered_local]
+                    current_local_names = {f.name for f in discovered_local}
                     removed_local = [f for f in rows if f['local_name'] not in current_local_names]
                     for f in removed_local:
                         # Local folder has been deleted, so delete remote
@@ -600,12 +621,12 @@ class NoteFolder:
         """
         folder_filter = (NoteFolder.SYNC_REMOTE_TO_LOCAL,)
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     sql_remote = "SELECT * FROM tb_folder WHERE sync_direction = ?"
                     rows = cursor.execute(sql_remote, folder_filter).fetchall()
-                    current_remote_names = [f.name for f in discovered_remote]
+                    current_remote_names = {f.name for f in discovered_remote}
                     removed_remote = [f for f in rows if f['remote_name'] not in current_remote_names]
                     for f in removed_remote:
                         # Remote folder has been deleted, so delete local
@@ -654,7 +675,7 @@ class NoteFolder:
 
         # Empty Table
 
-        with closing(sqlite3.connect(helpers.db_folder())) as connection:
+        with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
             connection.row_factory = sqlite3.Row
             with closing(connection.cursor()) as cursor:
                 cursor.execute("DELETE FROM tb_folder")
@@ -674,7 +695,7 @@ class NoteFolder:
 
         """
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     sql_create_note_table = """CREATE TABLE IF NOT EXISTS tb_note (
@@ -734,7 +755,7 @@ class NoteFolder:
                     ))
 
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     sql_delete_folders = "DELETE FROM tb_note"
@@ -749,52 +770,91 @@ class NoteFolder:
         return True, 'Notes stored in tb_notes'
 
     @staticmethod
-    def delete_local_notes(folder: NoteFolder, result: dict) -> tuple[bool, str]:
+    def get_saved_notes(folder_name: str | None = None, location: str | None = None) -> \
+            tuple[bool, str] | tuple[bool, List[sqlite3.Row]]:
         """
-        Delete notes from local which were deleted remotely.
+        Get the list of notes saved during the last sync from the database.
 
-        :param folder: the folder data.
-        :param result: dictionary where results are appended.
+        :param folder_name: if given, only notes in the folder with this name are returned.
+        :param location: if given with ``folder_name``, only notes in this location (``local`` or ``remote``) are returned.
 
         :returns:
 
-            -success (:py:class:`bool`) - true if local notes are successfully deleted.
+            -success (:py:class:`bool`) - true if the saved notes are successfully loaded.
 
-            -data (:py:class:`str`) - error message on failure, or success message.
+            -data (:py:class:`str` | :py:class:`List[sqlite3.Row]`) - error message on failure, or list of saved notes.
         """
-        delete_note_script = notescript.delete_note_script
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
-                    sql_remote_notes = "SELECT * FROM tb_note WHERE folder = ? AND location = ?"
-                    remote_filter = (folder.remote_folder.name, 'remote')
-                    rows = cursor.execute(sql_remote_notes, remote_filter).fetchall()
-                    for row in rows:
-                        if row['name'] not in [n.name for n in folder.remote_notes]:
-                            if helpers.confirm('Delete local note {}'.format(row['name'])):
-                                return_code, stdout, stderr = helpers.run_applescript(delete_note_script,
-                                                                                      folder.local_folder.name,
-                                                                                      row['name'])
-                                note_object = next((n for n in folder.local_notes if n.name == row['name']), None)
-                                if note_object is not None:
-                                    folder.local_notes.remove(note_object)
-                                if return_code != 0:
-                                    result['local_not_found'].append(row['name'])
-                                else:
-                                    result['local_deleted'].append(row['name'])
+                    if folder_name is None:
+                        rows = cursor.execute("SELECT * FROM tb_note").fetchall()
+                    else:
+                        sql_folder_notes = "SELECT * FROM tb_note WHERE folder = ? AND location = ?"
+                        rows = cursor.execute(sql_folder_notes, (folder_name, location)).fetchall()
         except sqlite3.OperationalError as e:
             return False, repr(e)
+        return True, rows
+
+    @staticmethod
+    def delete_local_notes(folder: NoteFolder, result: dict,
+                           saved_remote: List[sqlite3.Row] | None = None) -> tuple[bool, str]:
+        """
+        Delete notes from local which were deleted remotely.
+
+        :param folder: the folder data.
+        :param result: dictionary where results are appended.
+        :param saved_remote: the remote notes in this folder saved during the last sync. These are loaded from the database
+            if not given.
+
+        :returns:
+
+            -success (:py:class:`bool`) - true if local notes are successfully deleted.
+
+            -data (:py:class:`str`) - error message on failure, or success message.
+        """
+        delete_notes_script = notescript.delete_notes_script
+        if saved_remote is None:
+            success, data = NoteFolder.get_saved_notes(folder.remote_folder.name, 'remote')
+            if not success:
+                return False, data
+            saved_remote = data
+        rows = saved_remote
+
+        current_remote_names = {n.name for n in folder.remote_notes}
+        to_delete = []
+        for row in rows:
+            if row['name'] not in current_remote_names:
+                if helpers.confirm('Delete local note {}'.format(row['name'])):
+                    to_delete.append(row['name'])
+        if not to_delete:
+            return True, "Local notes deleted."
+
+        # Delete all notes in a single AppleScript call
+        return_code, stdout, stderr = helpers.run_applescript(delete_notes_script, folder.local_folder.name, *to_delete)
+        deleted = stdout.strip().split('|') if return_code == 0 else []
+        for idx, note_name in enumerate(to_delete):
+            note_object = next((n for n in folder.local_notes if n.name == note_name), None)
+            if note_object is not None:
+                folder.local_notes.remove(note_object)
+            if idx < len(deleted) and deleted[idx] == '1':
+                result['local_deleted'].append(note_name)
+            else:
+                result['local_not_found'].append(note_name)
         return True, "Local notes deleted."
 
     @staticmethod
-    def delete_remote_notes(folder: NoteFolder, remote_folder: Path, result: dict) -> tuple[bool, str]:
+    def delete_remote_notes(folder: NoteFolder, remote_folder: Path, result: dict,
+                            saved_local: List[sqlite3.Row] | None = None) -> tuple[bool, str]:
         """
         Delete notes from remote which were deleted locally.
 
         :param folder: the folder data.
         :param remote_folder: the remote folder.
         :param result: dictionary where results are appended.
+        :param saved_local: the local notes in this folder saved during the last sync. These are loaded from the database
+            if not given.
 
         :returns:
 
@@ -802,29 +862,27 @@ class NoteFolder:
 
             -data (:py:class:`str`) - error message on failure, or success message.
         """
-        try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
-                connection.row_factory = sqlite3.Row
-                with closing(connection.cursor()) as cursor:
-                    sql_local_notes = "SELECT * FROM tb_note WHERE folder = ? AND location = ?"
-                    local_filter = (folder.local_folder.name, 'local')
-                    rows = cursor.execute(sql_local_notes, local_filter).fetchall()
-                    for row in rows:
-                        if row['uuid'] not in [n.uuid for n in folder.local_notes]:
-                            try:
-                                remote_note = remote_folder / folder.remote_folder.name / (row['name'] + '.md')
-                                if helpers.confirm('Delete remote note {}'.format(row['name'])):
-                                    Path.unlink(remote_note)
-                                    note_object = next((n for n in folder.remote_notes if n.name == row['name']), None)
-                                    for attachment in note_object.attachments:
-                                        attachment.delete_remote()
-                                    if note_object is not None:
-                                        folder.remote_notes.remove(note_object)
-                                    result['remote_deleted'].append(row['name'])
-                            except FileNotFoundError:
-                                result['remote_not_found'].append(row['name'])
-        except sqlite3.OperationalError as e:
-            return False, repr(e)
+        if saved_local is None:
+            success, data = NoteFolder.get_saved_notes(folder.local_folder.name, 'local')
+            if not success:
+                return False, data
+            saved_local = data
+
+        current_local_uuids = {n.uuid for n in folder.local_notes}
+        for row in saved_local:
+            if row['uuid'] not in current_local_uuids:
+                try:
+                    remote_note = remote_folder / folder.remote_folder.name / (row['name'] + '.md')
+                    if helpers.confirm('Delete remote note {}'.format(row['name'])):
+                        Path.unlink(remote_note)
+                        note_object = next((n for n in folder.remote_notes if n.name == row['name']), None)
+                        if note_object is not None:
+                            for attachment in note_object.attachments:
+                                attachment.delete_remote()
+                            folder.remote_notes.remove(note_object)
+                        result['remote_deleted'].append(row['name'])
+                except FileNotFoundError:
+                    result['remote_not_found'].append(row['name'])
         return True, "Remote notes deleted."
 
     @staticmethod
@@ -868,6 +926,14 @@ class NoteFolder:
             'local_not_found': []
         }
 
+        # Load the notes saved during the last sync once, rather than querying once per folder and direction
+        success, data = NoteFolder.get_saved_notes()
+        if not success:
+            return False, data
+        saved_notes = {}
+        for row in data:
+            saved_notes.setdefault((row['folder'], row['location']), []).append(row)
+
         for folder in NoteFolder.FOLDER_LIST:
             if folder.sync_direction == NoteFolder.SYNC_NONE:
                 continue
@@ -881,11 +947,12 @@ class NoteFolder:
 
             # Delete remote notes which were deleted locally
             if folder.sync_direction == NoteFolder.SYNC_LOCAL_TO_REMOTE or folder.sync_direction == NoteFolder.SYNC_BOTH:
-                NoteFolder.delete_remote_notes(folder, remote_folder, result)
+                NoteFolder.delete_remote_notes(folder, remote_folder, result,
+                                               saved_notes.get((folder.local_folder.name, 'local'), []))
 
             # Delete local notes which were deleted remotely
             if folder.sync_direction == NoteFolder.SYNC_REMOTE_TO_LOCAL or folder.sync_direction == NoteFolder.SYNC_BOTH:
-                NoteFolder.delete_local_notes(folder, result)
+                NoteFolder.delete_local_notes(folder, result, saved_notes.get((folder.remote_folder.name, 'remote'), []))
 
         return True, result
 
@@ -993,10 +1060,9 @@ class RemoteNoteFolder:
 
         """
         try:
-            if os.path.exists(self.path):
-                shutil.rmtree(self.path)
-            else:
-                return True, 'Remote folder {} was already deleted.'.format(self.name)
+            shutil.rmtree(self.path)
+        except FileNotFoundError:
+            return True, 'Remote folder {} was already deleted.'.format(self.name)
         except OSError as e:
             return False, 'Error deleting remote folder {0}: {1}'.format(self.name, e)
         return True, 'Remote folder {} deleted.'.format(self.name)
@@ -125,6 +125,32 @@ tell application "Notes"
 end tell
 end run"""
 
+#: Delete several local notes from a folder. Returns a pipe-separated list with 1 for each deleted note, or 0 for each
+#: note which could not be deleted, in the order given.
+delete_notes_script = """on run argv
+set note_folder to item 1 of argv
+set output to ""
+tell application "Notes"
+    tell folder note_folder
+        repeat with idx from 2 to count of argv
+            set note_name to item idx of argv
+            try
+                delete note note_name
+                set deleted to "1"
+            on error
+                set deleted to "0"
+            end try
+            if output is "" then
+                set output to deleted
+            else
+                set output to output & "|" & deleted
+            end if
+        end repeat
+    end tell
+end tell
+return output
+end run"""
+
 #: Load the list of local folders from the default account.
 load_folders_script = """tell application "Notes"
     set output to ""
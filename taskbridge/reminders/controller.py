@@ -153,8 +153,7 @@ class ReminderController:
             error = 'Failed to associate containers: {}'.format(data)
             logging.critical(error)
             return False, error
-        debug_msg = 'Containers synchronised: {}'.format(ReminderContainer.CONTAINER_LIST)
-        logging.debug(debug_msg)
+        logging.debug('Containers synchronised: %s', ReminderContainer.CONTAINER_LIST)
         return True, ReminderContainer.CONTAINER_LIST
 
     @staticmethod
@@ -201,22 +200,52 @@ class ReminderController:
         """
         if len(ReminderContainer.CONTAINER_LIST) == 0:
             return True, {}
-        data = None
-        for container in ReminderContainer.CONTAINER_LIST:
-            success, data = container.sync_reminders()
-            if not success:
-                error = 'Failed to sync reminders {}'.format(data)
-                logging.critical(error)
-                return False, error
-        debug_msg = ("Reminder synchronisation:: Remote Added: {} | Remote Updated: {} | Local Added: {} | Local Updated: {"
-                     "}").format(
-            ','.join(data['remote_added'] if 'remote_added' in data else ['No remote reminders added']),
-            ', '.join(data['remote_updated'] if 'remote_updated' in data else ['No remote reminders updated']),
-            ', '.join(data['local_added'] if 'local_added' in data else ['No local reminders added']),
-            ', '.join(data['local_updated'] if 'local_updated' in data else ['No local reminders updated']))
-        logging.debug(debug_msg)
+        data = {
+            'remote_added': [],
+            'remote_updated': [],
+            'local_added': [],
+            'local_updated': []
+        }
+        # Containers are synchronised one at a time: they share a single CalDav client and HTTP session, which are not
+        # safe to use from several threads.
+        success, error = ReminderController._collect_sync_results(
+            (container.sync_reminders() for container in ReminderContainer.CONTAINER_LIST), data)
+        if not success:
+            logging.critical(error)
+            return False, error
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Reminder synchronisation:: Remote Added: %s | Remote Updated: %s | Local Added: %s | Local Updated: %s",
+                ','.join(data['remote_added'] if 'remote_added' in data else ['No remote reminders added']),
+                ', '.join(data['remote_updated'] if 'remote_updated' in data else ['No remote reminders updated']),
+                ', '.join(data['local_added'] if 'local_added' in data else ['No local reminders added']),
+                ', '.join(data['local_updated'] if 'local_updated' in data else ['No local reminders updated']))
         return True, data
 
+    @staticmethod
+    def _collect_sync_results(results, data: dict) -> tuple[bool, str]:
+        """
+        Merges the results of each container's reminder synchronisation into ``data``, stopping at the first failure.
+
+        :param results: an iterable of ``(success, data)`` tuples as returned by ``ReminderContainer.sync_reminders``.
+        :param data: dictionary where the lists of changed reminder names are merged.
+
+        :returns:
+
+            -success (:py:class:`bool`) - true if every container was successfully synchronised.
+
+            -data (:py:class:`str`) - error message on failure, or success message.
+
+        """
+        for success, container_data in results:
+            if not success:
+                return False, 'Failed to sync reminders {}'.format(container_data)
+            # Containers set to NO SYNC return a message rather than a result dictionary
+            if isinstance(container_data, dict):
+                for key, names in container_data.items():
+                    data.setdefault(key, []).extend(names)
+        return True, 'Reminders synchronised'
+
     @staticmethod
     def sync_reminders_to_db() -> tuple[bool, str]:
         """
@@ -255,8 +284,7 @@ class ReminderController:
             error = data
             logging.critical(error)
             return False, error
-        debug_msg = 'Number of completed reminders: {}'.format(data)
-        logging.debug(debug_msg)
+        logging.debug('Number of completed reminders: %s', data)
         return True, data
 
     @staticmethod
@@ -14,6 +14,14 @@ from taskbridge import helpers
 from taskbridge.helpers import DateUtil
 from taskbridge.reminders.model import reminderscript
 
+#: Opening lines of the iCal string for every task, which never change.
+_ICAL_PREFIX = ("BEGIN:VCALENDAR\n"
+                "VERSION:2.0\n"
+                "PRODID:-//Pint-Sized Software//TaskBridge//NONSGML v1.0//EN\n"
+                "BEGIN:VTODO\n")
+#: Closing lines of the iCal string for every task.
+_ICAL_SUFFIX = "END:VTODO\nEND:VCALENDAR\n"
+
 
 class Reminder:
     """
@@ -81,21 +89,22 @@ class Reminder:
 
         :return: a Reminder instance representing the content of the values given.
         """
-        values[4] = values[4].strip()
-        values[5] = values[5].strip()
-        values[6] = values[6].strip()
-        values[9] = values[9].strip()
+        uuid, name, created, completed, due, all_day, remind_me, modified = values[:8]
+        due = due.strip()
+        remind_me = remind_me.strip()
+        body = values[9].strip()
+        modified_date = DateUtil.convert(DateUtil.APPLE_DATETIME, modified.strip())
         return Reminder(
-            uuid=values[0],
-            name=values[1],
-            created_date=DateUtil.convert(DateUtil.APPLE_DATETIME, values[2].strip()),
-            modified_date=DateUtil.convert(DateUtil.APPLE_DATETIME, values[7].strip()),
-            completed_date=DateUtil.convert(DateUtil.APPLE_DATETIME, values[7].strip()),
-            body=values[9] if values[9] != 'missing value' else None,
-            remind_me_date=None if values[6] == 'missing value' else DateUtil.convert(DateUtil.APPLE_DATETIME, values[6]),
-            due_date=None if values[4] == 'missing value' else DateUtil.convert(DateUtil.APPLE_DATETIME, values[4]),
-            all_day=False if values[5] == "missing value" else True,
-            completed=False if values[3] == "false" else True
+            uuid=uuid,
+            name=name,
+            created_date=DateUtil.convert(DateUtil.APPLE_DATETIME, created.strip()),
+            modified_date=modified_date,
+            completed_date=modified_date,
+            body=body if body != 'missing value' else None,
+            remind_me_date=None if remind_me == 'missing value' else DateUtil.convert(DateUtil.APPLE_DATETIME, remind_me),
+            due_date=None if due == 'missing value' else DateUtil.convert(DateUtil.APPLE_DATETIME, due),
+            all_day=False if all_day.strip() == "missing value" else True,
+            completed=False if completed == "false" else True
         )
 
     @staticmethod
@@ -108,6 +117,7 @@ class Reminder:
         """
 
         comp = caldav_task.icalendar_component
+        due = comp['DUE'].dt if 'DUE' in comp else None
 
         return Reminder(
             uuid=comp['UID'].to_ical().decode() if 'UID' in comp else None,
@@ -117,8 +127,8 @@ class Reminder:
             completed_date=comp['COMPLETED'].dt if 'COMPLETED' in comp else None,
             body=comp['description'].to_ical().decode() if 'DESCRIPTION' in comp else None,
             remind_me_date=comp['TRIGGER'].dt if 'TRIGGER' in comp else None,
-            due_date=comp['DUE'].dt if 'DUE' in comp else None,
-            all_day=True if 'DUE' in comp and comp['DUE'].dt.strftime("%H:%M:%S") == "00:00:00" else False,
+            due_date=due,
+            all_day=due is not None and DateUtil.is_midnight(due),
             completed='COMPLETED' in comp
         )
 
@@ -167,14 +177,7 @@ class Reminder:
         :return: the task in CalDAV matching this tasks UUID/name, or None.
         """
 
-        remote = None
-        tasks_in_caldav = container.remote_calendar.cal_obj.search(todo=True, uid=self.uuid)
-        if len(tasks_in_caldav) == 0:
-            tasks_in_caldav = container.remote_calendar.cal_obj.search(todo=True, summary=self.name)
-
-        if len(tasks_in_caldav) > 0:
-            remote = tasks_in_caldav[0]
-        return remote
+        return container.get_remote_task(self.uuid, self.name)
 
     def __get_task_due_date(self) -> tuple[bool, str]:
         """
@@ -190,7 +193,7 @@ class Reminder:
         try:
             if not self.due_date:
                 due_date = None
-            elif self.due_date.strftime("%H:%M:%S") == "00:00:00":
+            elif DateUtil.is_midnight(self.due_date):
                 due_date = DateUtil.convert('', self.due_date, DateUtil.CALDAV_DATE)
             else:
                 due_date = DateUtil.convert('', self.due_date, DateUtil.CALDAV_DATETIME)
@@ -219,7 +222,8 @@ class Reminder:
             if not success:
                 return False, 'Unable to convert reminder {} to iCal string'.format(self.name)
             ical_string = data
-            container.remote_calendar.cal_obj.save_todo(ical=ical_string)
+            task = container.remote_calendar.cal_obj.save_todo(ical=ical_string)
+            container.update_remote_task_uid(None, self.uuid, task)
             return True, 'Remote reminder added: {}'.format(self.name)
         else:
             # Update existing remote task
@@ -231,22 +235,25 @@ class Reminder:
             if not self.remind_me_date:
                 alarm_trigger = None
             else:
-                if self.remind_me_date.strftime("%H:%M:%S") == "00:00:00":
+                if DateUtil.is_midnight(self.remind_me_date):
                     # Alarm with no time
                     self.remind_me_date = self.remind_me_date.replace(hour=self.default_alarm_hour, minute=0)
                 alarm_trigger = DateUtil.convert('', self.remind_me_date, DateUtil.CALDAV_DATETIME)
 
-            remote.icalendar_component["uid"] = self.uuid
-            remote.icalendar_component["summary"] = self.name
+            comp = remote.icalendar_component
+            old_uid = comp["uid"].to_ical().decode() if "uid" in comp else None
+            comp["uid"] = self.uuid
+            comp["summary"] = self.name
             if due_date:
-                remote.icalendar_component["due"] = due_date
-            remote.icalendar_component["status"] = 'COMPLETED' if self.completed else 'NEEDS-ACTION'
+                comp["due"] = due_date
+            comp["status"] = 'COMPLETED' if self.completed else 'NEEDS-ACTION'
             if alarm_trigger:
-                remote.icalendar_component["trigger"] = alarm_trigger
+                comp["trigger"] = alarm_trigger
             if self.completed:
-                remote.icalendar_component["PERCENT-COMPLETE"] = "100"
-                remote.icalendar_component["COMPLETED"] = DateUtil.convert('', self.completed_date, DateUtil.CALDAV_DATETIME)
+                comp["PERCENT-COMPLETE"] = "100"
+                comp["COMPLETED"] = DateUtil.convert('', self.completed_date, DateUtil.CALDAV_DATETIME)
             remote.save()
+            container.update_remote_task_uid(old_uid, self.uuid, remote)
             return True, 'Remote reminder updated: {}'.format(self.name)
 
     def update_uuid(self, container: model.ReminderContainer, new_uuid: str) -> tuple[bool, str]:
@@ -264,12 +271,13 @@ class Reminder:
             -data (:py:class:`str`) - error message on failure or success message.
 
         """
-        tasks_in_caldav = container.remote_calendar.cal_obj.search(todo=True, uid=self.uuid)
-        if len(tasks_in_caldav) > 0:
-            remote = tasks_in_caldav[0]
+        remote = container.get_remote_task(self.uuid)
+        if remote is not None:
+            old_uid = self.uuid
             self.uuid = new_uuid
             remote.icalendar_component["uid"] = self.uuid
             remote.save()
+            container.update_remote_task_uid(old_uid, self.uuid)
             return True, 'Remote reminder UID updated'
         return False, 'Could not find remote reminder to update UUID: {} ({})'.format(self.uuid, self.name)
 
@@ -296,31 +304,18 @@ class Reminder:
 
         modification_date = DateUtil.convert('', self.modified_date, DateUtil.CALDAV_DATETIME)
 
-        ical_string = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Pint-Sized Software//TaskBridge//NONSGML v1.0//EN
-BEGIN:VTODO
-"""
-        if due_string is not None:
-            ical_string += due_string + "\n"
-
-        ical_string += """DTSTAMP:{modification_date}
-LAST-MODIFIED:{modification_date}
-SUMMARY:{summary}
-STATUS:{status}
-UID:{id}
-""".format(modification_date=modification_date,
-           summary=self.name,
-           status='COMPLETED' if self.completed else 'NEEDS-ACTION',
-           id=self.uuid)
-
+        ical_lines = [] if due_string is None else [due_string]
+        ical_lines.extend([
+            "DTSTAMP:{}".format(modification_date),
+            "LAST-MODIFIED:{}".format(modification_date),
+            "SUMMARY:{}".format(self.name),
+            "STATUS:{}".format('COMPLETED' if self.completed else 'NEEDS-ACTION'),
+            "UID:{}".format(self.uuid)
+        ])
         if alarm_string is not None:
-            ical_string += alarm_string + "\n"
-
-        ical_string += """END:VTODO
-END:VCALENDAR
-"""
-        return True, ical_string
+            ical_lines.append(alarm_string)
+        ical_lines.append(_ICAL_SUFFIX)
+        return True, _ICAL_PREFIX + "\n".join(ical_lines)
 
     def _parse_due_date(self) -> tuple[bool, str] | tuple[bool, None]:
         """
@@ -339,7 +334,7 @@ END:VCALENDAR
         due_date = None
         due_string = None
         try:
-            if self.due_date.strftime("%H:%M:%S") == "00:00:00":
+            if DateUtil.is_midnight(self.due_date):
                 ds = DateUtil.convert('', self.due_date, DateUtil.CALDAV_DATE)
                 if ds:
                     due_date = 'DATE:' + ds
@@ -369,7 +364,7 @@ END:VCALENDAR
         alarm_trigger = None
         alarm_string = None
         try:
-            if self.remind_me_date.strftime("%H:%M:%S") == "00:00:00":
+            if DateUtil.is_midnight(self.remind_me_date):
                 # Alarm with no time
                 self.remind_me_date = self.remind_me_date.replace(hour=self.default_alarm_hour, minute=0)
             ds = DateUtil.convert('', self.remind_me_date, DateUtil.CALDAV_DATETIME)
@@ -7,7 +7,6 @@ Many of the synchronisation methods are here.
 from __future__ import annotations
 
 import copy
-import glob
 import os
 import sqlite3
 from contextlib import closing
@@ -46,6 +45,7 @@ class ReminderContainer:
         self.sync: bool = sync
         self.local_reminders: List[model.Reminder] = []
         self.remote_reminders: List[model.Reminder] = []
+        self.remote_tasks: dict[str, caldav.CalendarObjectResource] | None = None
         ReminderContainer.CONTAINER_LIST.append(self)
 
     @staticmethod
@@ -164,10 +164,11 @@ class ReminderContainer:
             -data (:py:class:`str`) - error message on failure, or success message.
 
         """
+        remote_by_name = {rc.name: rc for rc in reversed(remote_calendars)}
         for local_list in local_lists:
             should_sync = local_list.name in to_sync
             remote_name = "Tasks" if local_list.name == "Reminders" else local_list.name
-            remote_calendar = next((rc for rc in remote_calendars if rc.name == remote_name), None)
+            remote_calendar = remote_by_name.get(remote_name)
             if remote_calendar is None and should_sync and helpers.confirm('Create remote calendar {}'.format(remote_name)):
                 remote_calendar = RemoteCalendar(calendar_name=remote_name)
                 success, data = remote_calendar.create()
@@ -194,17 +195,18 @@ class ReminderContainer:
             -data (:py:class:`str`) - error message on failure, or success message.
 
         """
+        synced_remote_names = {cont.remote_calendar.name for cont in ReminderContainer.CONTAINER_LIST if
+                               cont.remote_calendar is not None}
+        local_by_name = {ll.name: ll for ll in reversed(local_lists)}
         for remote_calendar in remote_calendars:
-            synced_remote_calendars = [cont.remote_calendar for cont in ReminderContainer.CONTAINER_LIST if
-                                       cont.remote_calendar is not None]
             if remote_calendar is None:
                 continue
-            if remote_calendar.name in [rc.name for rc in synced_remote_calendars]:
+            if remote_calendar.name in synced_remote_names:
                 continue
 
             should_sync = remote_calendar.name in to_sync
             local_name = "Reminders" if remote_calendar.name == "Tasks" else remote_calendar.name
-            local_list = next((ll for ll in local_lists if ll.name == local_name), None)
+            local_list = local_by_name.get(local_name)
             if local_list is None and should_sync and helpers.confirm('Create local list {}'.format(local_name)):
                 local_list = LocalList(list_name=local_name)
                 try:
@@ -214,6 +216,7 @@ class ReminderContainer:
                 except AttributeError as e:
                     return False, e.__str__()
             ReminderContainer(local_list, remote_calendar, should_sync)
+            synced_remote_names.add(remote_calendar.name)
         return True, "Remote lists associated with local lists"
 
     @staticmethod
@@ -262,7 +265,7 @@ class ReminderContainer:
 
         """
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     sql_create_container_table = """CREATE TABLE IF NOT EXISTS tb_container (
@@ -297,9 +300,13 @@ class ReminderContainer:
             ))
 
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
+                    # Containers rarely change between syncs, so only rewrite the table when they do
+                    sql_saved_containers = "SELECT local_name, remote_name, sync FROM tb_container ORDER BY id"
+                    if [tuple(row) for row in cursor.execute(sql_saved_containers)] == containers:
+                        return True, 'Containers stored tb_container'
                     sql_delete_containers = "DELETE FROM tb_container"
                     cursor.execute(sql_delete_containers)
                     sql_insert_containers = "INSERT INTO tb_container(local_name, remote_name, sync) VALUES (?, ?, ?)"
@@ -322,18 +329,18 @@ class ReminderContainer:
 
         """
         try:
-            con = sqlite3.connect(helpers.db_folder())
-            cur = con.cursor()
-            sql_create_reminder_table = """CREATE TABLE IF NOT EXISTS tb_reminder (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        local_uuid TEXT,
-                        local_name TEXT,
-                        remote_uuid TEXT,
-                        remote_name TEXT,
-                        local_container TEXT,
-                        remote_container TEXT
-                        );"""
-            cur.execute(sql_create_reminder_table)
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
+                with closing(connection.cursor()) as cursor:
+                    sql_create_reminder_table = """CREATE TABLE IF NOT EXISTS tb_reminder (
+                                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                        local_uuid TEXT,
+                                        local_name TEXT,
+                                        remote_uuid TEXT,
+                                        remote_name TEXT,
+                                        local_container TEXT,
+                                        remote_container TEXT
+                                        );"""
+                    cursor.execute(sql_create_reminder_table)
         except sqlite3.OperationalError as e:
             return False, repr(e)
         return True, 'tb_reminder table created'
@@ -376,7 +383,7 @@ class ReminderContainer:
                 ))
 
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     sql_delete_reminders = "DELETE FROM tb_reminder"
@@ -449,9 +456,9 @@ class ReminderContainer:
             -data (:py:class:`str`) - error message on failure or success message.
 
         """
+        removed_local_names = {rl['remote_name'] for rl in removed_local_containers}
         for remote in removed_remote_containers:
-            if remote['remote_name'] in to_sync and remote['remote_name'] not in [rl['remote_name'] for rl in
-                                                                                  removed_local_containers]:
+            if remote['remote_name'] in to_sync and remote['remote_name'] not in removed_local_names:
                 # Remote container has been deleted, so delete local
                 if helpers.confirm('Delete local container {}'.format(remote['remote_name'])):
                     local_name = "Reminders" if remote['remote_name'] == "Tasks" else remote['remote_name']
@@ -506,7 +513,7 @@ class ReminderContainer:
         else:
             helpers.DATA_LOCATION = Path.home() / "Library" / "Application Support" / "TaskBridge"
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     sql_get_containers = "SELECT * FROM tb_container WHERE sync = ?"
@@ -517,12 +524,12 @@ class ReminderContainer:
         if not len(saved_containers) > 0 or fail == "fail_already_deleted":
             return True, result
 
-        current_local_containers = [ll.name for ll in discovered_local]
+        current_local_containers = {ll.name for ll in discovered_local}
         removed_local_containers = [ll for ll in saved_containers if ll['local_name'] not in current_local_containers]
         ReminderContainer._delete_remote_containers(removed_local_containers, discovered_remote, to_sync, result)
 
         # Sync remote deletions to local
-        current_remote_containers = [rc.name for rc in discovered_remote]
+        current_remote_containers = {rc.name for rc in discovered_remote}
         removed_remote_containers = [rc for rc in saved_containers if
                                      rc['remote_name'] not in current_remote_containers]
         ReminderContainer._delete_local_containers(removed_remote_containers, removed_local_containers, discovered_local,
@@ -534,7 +541,7 @@ class ReminderContainer:
         else:
             helpers.DATA_LOCATION = Path.home() / "Library" / "Application Support" / "TaskBridge"
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     cursor.execute("DELETE FROM tb_container")
@@ -561,16 +568,17 @@ class ReminderContainer:
             -data (:py:class:`str`) - error message on failure or success message.
 
         """
-        local_deleted = [r for r in container_saved_local if
-                         r['local_name'] not in [lr.name for lr in container.local_reminders]]
+        current_local_names = {lr.name for lr in container.local_reminders}
+        local_deleted = [r for r in container_saved_local if r['local_name'] not in current_local_names]
         for deleted in local_deleted:
             remote_reminder = next((r for r in container.remote_reminders
                                     if r.uuid == deleted['local_uuid'] or r.name == deleted['local_name']), None)
             if remote_reminder is not None:
                 if helpers.confirm("Delete remote reminder {}".format(remote_reminder.name)):
-                    to_delete = container.remote_calendar.cal_obj.search(todo=True, uid=remote_reminder.uuid)
-                    if len(to_delete) > 0:
-                        to_delete[0].delete()
+                    to_delete = container.get_remote_task(remote_reminder.uuid)
+                    if to_delete is not None:
+                        to_delete.delete()
+                        container.update_remote_task_uid(remote_reminder.uuid, None)
                         container.remote_reminders.remove(remote_reminder)
                         result['deleted_remote_reminders'].append(remote_reminder)
                     else:
@@ -598,20 +606,31 @@ class ReminderContainer:
             -data (:py:class:`str`) - error message on failure or success message.
 
         """
-        remote_deleted = [r for r in container_saved_remote if
-                          r['remote_name'] not in [rr.name for rr in container.remote_reminders]]
+        current_remote_names = {rr.name for rr in container.remote_reminders}
+        remote_deleted = [r for r in container_saved_remote if r['remote_name'] not in current_remote_names]
+        to_delete = []
         for deleted in remote_deleted:
             local_reminder = next((r for r in container.local_reminders
-                                   if r.uuid == deleted['remote_uuid'] or r.name == deleted['remote_name']), None)
-            if local_reminder is not None:
-                if helpers.confirm("Delete local reminder {}".format(local_reminder.name)):
-                    delete_reminder_script = reminderscript.delete_reminder_script
-                    return_code, stdout, stderr = helpers.run_applescript(delete_reminder_script, local_reminder.uuid)
-                    if return_code != 0 or fail:
-                        return False, 'Failed to delete local reminder {0} ({1})'.format(local_reminder.uuid,
-                                                                                         local_reminder.name)
-                    container.local_reminders.remove(local_reminder)
-                    result['deleted_local_reminders'].append(local_reminder)
+                                   if r not in to_delete and
+                                   (r.uuid == deleted['remote_uuid'] or r.name == deleted['remote_name'])), None)
+            if local_reminder is not None and helpers.confirm("Delete local reminder {}".format(local_reminder.name)):
+                to_delete.append(local_reminder)
+        if not to_delete:
+            return True, "Local reminders deleted."
+
+        # Delete all reminders in a single AppleScript call
+        delete_reminders_script = reminderscript.delete_reminders_script
+        return_code, stdout, stderr = helpers.run_applescript(delete_reminders_script, *(r.uuid for r in to_delete))
+        deleted_flags = stdout.strip().split('|') if return_code == 0 else []
+        failed = None
+        for idx, local_reminder in enumerate(to_delete):
+            if fail or idx >= len(deleted_flags) or deleted_flags[idx] != '1':
+                failed = failed or local_reminder
+                continue
+            container.local_reminders.remove(local_reminder)
+            result['deleted_local_reminders'].append(local_reminder)
+        if failed is not None:
+            return False, 'Failed to delete local reminder {0} ({1})'.format(failed.uuid, failed.name)
         return True, "Local reminders deleted."
 
     @staticmethod
@@ -627,7 +646,7 @@ class ReminderContainer:
 
         """
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     sql_get_reminders = "SELECT * FROM tb_reminder"
@@ -682,7 +701,7 @@ class ReminderContainer:
         else:
             helpers.DATA_LOCATION = Path.home() / "Library" / "Application Support" / "TaskBridge"
         try:
-            with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            with closing(sqlite3.connect(helpers.db_folder(), timeout=helpers.DB_TIMEOUT)) as connection:
                 connection.row_factory = sqlite3.Row
                 with closing(connection.cursor()) as cursor:
                     cursor.execute("DELETE FROM tb_reminder")
@@ -690,6 +709,34 @@ class ReminderContainer:
             return False, 'Error deleting reminder table: {}'.format(e)
         return True, "Reminder table emptied."
 
+    @staticmethod
+    def _delete_saved_reminders(saved_reminders: List[sqlite3.Row], result: dict) -> None:
+        """
+        Deletes the counterparts of saved reminders which are no longer present, container by container. The saved
+        reminders are grouped by container once, rather than being filtered again for every container.
+
+        :param saved_reminders: the reminders saved during the last sync.
+        :param result: dictionary where deleted reminders are added.
+
+        """
+        saved_by_local_container = {}
+        saved_by_remote_container = {}
+        for saved in saved_reminders:
+            saved_by_local_container.setdefault(saved['local_container'], []).append(saved)
+            saved_by_remote_container.setdefault(saved['remote_container'], []).append(saved)
+
+        for container in ReminderContainer.CONTAINER_LIST:
+            if container.local_list is None or container.remote_calendar is None:
+                continue
+            container_saved_local = saved_by_local_container.get(container.local_list.name, [])
+            container_saved_remote = saved_by_remote_container.get(container.remote_calendar.name, [])
+
+            # Reminders deleted locally need to be deleted from CalDav
+            ReminderContainer._delete_remote_reminders(container_saved_local, container, result)
+
+            # Reminders deleted remotely need to be deleted from local
+            ReminderContainer._delete_local_reminders(container_saved_remote, container, result)
+
     @staticmethod
     def sync_reminder_deletions(fail: str = None) -> tuple[bool, str] | tuple[bool, dict]:
         """
@@ -743,18 +790,7 @@ class ReminderContainer:
         if not len(saved_reminders) > 0 or fail == "fail_already_deleted":
             return True, result
 
-        for container in ReminderContainer.CONTAINER_LIST:
-            if container.local_list is None or container.remote_calendar is None:
-                continue
-            container_saved_local = [r for r in saved_reminders if r['local_container'] == container.local_list.name]
-            container_saved_remote = [r for r in saved_reminders if
-                                      r['remote_container'] == container.remote_calendar.name]
-
-            # Reminders deleted locally need to be deleted from CalDav
-            ReminderContainer._delete_remote_reminders(container_saved_local, container, result)
-
-            # Reminders deleted remotely need to be deleted from local
-            ReminderContainer._delete_local_reminders(container_saved_remote, container, result)
+        ReminderContainer._delete_saved_reminders(saved_reminders, result)
 
         # Empty table
         success, data = ReminderContainer.__empty_reminder_table(fail)
@@ -787,19 +823,18 @@ class ReminderContainer:
         if fail == "fail_psv":
             export_path = "BOGUS"
         try:
-            with open(export_path) as fp:
-                file_data = fp.read()
-                fp.close()
+            with open(export_path, buffering=1 << 16) as fp:
+                for local_reminder in fp:
+                    values = local_reminder.rstrip('\n').split('|', 9)
+                    if len(values) > 0 and values[0] != '':
+                        self.local_reminders.append(model.Reminder.create_from_local(values))
         except FileNotFoundError as e:
             return False, 'Could not open exported reminder file {0}: {1}'.format(export_path, e)
-        for local_reminder in file_data.split('\n'):
-            values = local_reminder.split('|')
-            if len(values) > 0 and values[0] != '':
-                self.local_reminders.append(model.Reminder.create_from_local(values))
 
-        psv_files = glob.glob(stdout.strip() + '/*.psv')
-        for psv in psv_files:
-            os.remove(psv)
+        with os.scandir(stdout.strip()) as entries:
+            for entry in entries:
+                if entry.name.endswith('.psv') and not entry.name.startswith('.') and entry.is_file(follow_symlinks=False):
+                    os.unlink(entry.path)
 
         return True, len(self.local_reminders)
 
@@ -815,11 +850,108 @@ class ReminderContainer:
 
         """
         caldav_tasks = self.remote_calendar.cal_obj.todos()
+        self.remote_tasks = {}
         for task in caldav_tasks:
-            self.remote_reminders.append(model.Reminder.create_from_remote(task))
+            remote_reminder = model.Reminder.create_from_remote(task)
+            self.remote_reminders.append(remote_reminder)
+            # As with a search by UID, the first task with a given UID wins
+            self.remote_tasks.setdefault(remote_reminder.uuid, task)
 
         return True, len(self.remote_reminders)
 
+    def get_remote_task(self, uid: str | None, name: str | None = None) -> caldav.CalendarObjectResource | None:
+        """
+        Get the CalDav task with the given UID or, failing that, the given name.
+
+        Once ``load_remote_reminders`` has been called, tasks are looked up from the ones already fetched rather than
+        searching the CalDav server for every reminder. Either way, a task matches by name if its summary is equal to
+        ``name``, ignoring case.
+
+        :param uid: the UID of the task.
+        :param name: if given, the summary of the task to look for when no task has the given UID.
+
+        :return: the matching CalDav task, or None.
+        """
+        if self.remote_tasks is None:
+            tasks = self.remote_calendar.cal_obj.search(todo=True, uid=uid)
+            if len(tasks) == 0 and name is not None:
+                # The server matches any summary containing the name, so narrow the results down to equal summaries
+                tasks = [t for t in self.remote_calendar.cal_obj.search(todo=True, summary=name)
+                         if ReminderContainer._summary_matches(t, name)]
+            return tasks[0] if len(tasks) > 0 else None
+
+        task = self.remote_tasks.get(uid)
+        if task is None and name is not None:
+            task = next((t for t in self.remote_tasks.values() if ReminderContainer._summary_matches(t, name)), None)
+        return task
+
+    @staticmethod
+    def _summary_matches(task: caldav.CalendarObjectResource, name: str) -> bool:
+        """
+        Check whether the summary of a CalDav task is equal to the given name, ignoring case.
+
+        :param task: the CalDav task.
+        :param name: the name to compare with.
+
+        :return: True if the task has a summary equal to ``name``. Tasks without a summary never match.
+        """
+        summary = task.icalendar_component.get('summary')
+        return summary is not None and str(summary).casefold() == name.casefold()
+
+    def update_remote_task_uid(self, old_uid: str | None, new_uid: str | None,
+                               task: caldav.CalendarObjectResource | None = None) -> None:
+        """
+        Keep the fetched CalDav tasks in step with a task whose UID has changed, or which has been added or deleted.
+
+        :param old_uid: the previous UID of the task, or None if the task is new.
+        :param new_uid: the new UID of the task, or None if the task has been deleted.
+        :param task: the task, if not already known under ``old_uid``.
+        """
+        if self.remote_tasks is None:
+            return
+        previous = self.remote_tasks.pop(old_uid, None) if old_uid is not None else None
+        task = task if task is not None else previous
+        if new_uid is not None and task is not None:
+            self.remote_tasks[new_uid] = task
+
+    @staticmethod
+    def _index_reminders(reminders: List[model.Reminder]) -> tuple[dict, dict]:
+        """
+        Index a list of reminders by UUID and by name, keeping the position of the first reminder for each key.
+
+        :param reminders: the reminders to index
+
+        :returns:
+
+            -by_uuid (:py:class:`dict`) - position of the first reminder with each UUID.
+
+            -by_name (:py:class:`dict`) - position of the first reminder with each name.
+
+        """
+        by_uuid = {}
+        by_name = {}
+        for i, reminder in enumerate(reminders):
+            by_uuid.setdefault(reminder.uuid, i)
+            by_name.setdefault(reminder.name, i)
+        return by_uuid, by_name
+
+    @staticmethod
+    def _find_reminder(reminders: List[model.Reminder], index: tuple[dict, dict],
+                       reminder: model.Reminder) -> model.Reminder | None:
+        """
+        Find the first reminder in ``reminders`` sharing a UUID or a name with ``reminder``.
+
+        :param reminders: the reminders to search
+        :param index: the index of ``reminders`` returned by ``_index_reminders``
+        :param reminder: the reminder to match
+
+        :returns: the first matching reminder, or None if there is no match.
+
+        """
+        by_uuid, by_name = index
+        positions = [p for p in (by_uuid.get(reminder.uuid), by_name.get(reminder.name)) if p is not None]
+        return reminders[min(positions)] if positions else None
+
     def sync_local_reminders_to_remote(self, result: dict, fail: str = None) -> tuple[bool, str]:
         """
         Sync local reminders to remote tasks.
@@ -834,10 +966,10 @@ class ReminderContainer:
             -data (:py:class:`str`) - error message on failure or success message.
 
         """
+        remote_index = ReminderContainer._index_reminders(self.remote_reminders)
         for local_reminder in self.local_reminders:
             # Get the associated remote reminder, if any
-            remote_reminder = next((r for r in self.remote_reminders
-                                    if r.uuid == local_reminder.uuid or r.name == local_reminder.name), None)
+            remote_reminder = ReminderContainer._find_reminder(self.remote_reminders, remote_index, local_reminder)
             if (remote_reminder is None or
                     local_reminder.modified_date.replace(tzinfo=None) > remote_reminder.modified_date.replace(tzinfo=None)):
                 key = 'remote_added' if remote_reminder is None else 'remote_updated'
@@ -878,10 +1010,10 @@ class ReminderContainer:
             -data (:py:class:`str`) - error message on failure or success message.
 
         """
+        local_index = ReminderContainer._index_reminders(self.local_reminders)
         for remote_reminder in self.remote_reminders:
             # Get the associated local reminder, if any
-            local_reminder = next((r for r in self.local_reminders
-                                   if r.uuid == remote_reminder.uuid or r.name == remote_reminder.name), None)
+            local_reminder = ReminderContainer._find_reminder(self.local_reminders, local_index, remote_reminder)
             if local_reminder is None:
                 key = 'local_added'
                 local_reminder = copy.deepcopy(remote_reminder)
@@ -113,6 +113,28 @@ tell application "Reminders"
 end tell
 end run'''
 
+#: Delete the reminders with the given UUIDs. Returns a pipe-separated list with 1 for each deleted reminder, 0 otherwise.
+delete_reminders_script = '''on run argv
+set output to ""
+tell application "Reminders"
+    repeat with idx from 1 to count of argv
+        set r_id to item idx of argv
+        try
+            delete reminder id r_id
+            set deleted to "1"
+        on error
+            set deleted to "0"
+        end try
+        if output is "" then
+            set output to deleted
+        else
+            set output to output & "|" & deleted
+        end if
+    end repeat
+end tell
+return output
+end run'''
+
 #: Delete the list with the given name in the default account.
 delete_list_script = '''on run argv
 set r_list to item 1 of argv
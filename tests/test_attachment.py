@@ -1,7 +1,9 @@
+import base64
 import os
 import pathlib
 import shutil
 from pathlib import Path
+from unittest import mock
 
 import pytest
 from decouple import config
@@ -69,6 +71,19 @@ class TestAttachment:
         if os.path.isfile(tmp_local):
             os.remove(tmp_local)
 
+    def test_save_image_to_file_line_breaks(self, tmp_path):
+        image = bytes(range(256)) * 20
+        b64_lines = base64.encodebytes(image).decode('ascii')
+        for b64_data in [b64_lines, b64_lines.replace('\n', '\r\n')]:
+            att = Attachment(Attachment.TYPE_IMAGE, "lines.png", 'missing value', 'data:image/png;base64,' + b64_data,
+                             'lines.png')
+
+            # Line breaks must not shift the 4-character groups across chunk boundaries
+            with mock.patch.object(Attachment, '_B64_CHUNK_SIZE', 101):
+                success, data = att.save_image_to_file(tmp_path)
+            assert success is True
+            assert data.read_bytes() == image
+
     @pytest.mark.skipif(TEST_ENV != 'local', reason="Requires local filesystem.")
     def test_delete_remote(self):
         att = TestAttachment.__create_remote_attachment()
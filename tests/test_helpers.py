@@ -84,6 +84,22 @@ class TestHelpers:
         assert result == data_location
         assert data_location.is_dir()
 
+    def test_atomic_open(self, tmp_path):
+        target = tmp_path / 'conf.json'
+        target.write_text('old')
+
+        with helpers.atomic_open(target) as fp:
+            fp.write('new')
+        assert target.read_text() == 'new'
+
+        # A failed write leaves the original file and no temporary file behind
+        with pytest.raises(ValueError):
+            with helpers.atomic_open(target) as fp:
+                fp.write('partial')
+                raise ValueError
+        assert target.read_text() == 'new'
+        assert [p.name for p in tmp_path.iterdir()] == ['conf.json']
+
     def test_convert(self):
         apple_datetime = "Friday, 24 May 2024 at 09:54:59"
         apple_datetime_alt = "Friday 24 May 2024 at 09:54:59"
@@ -133,6 +149,13 @@ class TestHelpers:
         result = DateUtil.convert('', existing_date, DateUtil.SQLITE_DATETIME)
         assert result == sqlite_datetime
 
+    def test_convert_aware_datetimes(self):
+        # Aware datetimes for the same instant compare equal, but must still be formatted in their own timezone
+        utc = datetime.datetime(2024, 5, 24, 9, 54, 59, tzinfo=datetime.timezone.utc)
+        bst = utc.astimezone(datetime.timezone(datetime.timedelta(hours=1)))
+        assert DateUtil.convert('', utc, DateUtil.SQLITE_DATETIME) == "2024-05-24 09:54:59"
+        assert DateUtil.convert('', bst, DateUtil.SQLITE_DATETIME) == "2024-05-24 10:54:59"
+
         class MockDateTime:
             def __init__(self, *args):
                 pass
@@ -145,6 +168,24 @@ class TestHelpers:
         result = DateUtil.convert('', bogus_date, '%m-%d-%Y %T%Q:%M%p')
         assert result is False
 
+    def test_is_midnight(self):
+        assert DateUtil.is_midnight(datetime.datetime(2024, 1, 1, 0, 0, 0)) is True
+        assert DateUtil.is_midnight(datetime.datetime(2024, 1, 1, 0, 0, 1)) is False
+        assert DateUtil.is_midnight(datetime.datetime(2024, 1, 1, 9, 0, 0)) is False
+        assert DateUtil.is_midnight(datetime.date(2024, 1, 1)) is True
+
+    def test_parse_fixed_width(self):
+        assert DateUtil._parse_fixed_width(DateUtil.CALDAV_DATETIME, "20240524T095459") == datetime.datetime(
+            2024, 5, 24, 9, 54, 59)
+        assert DateUtil._parse_fixed_width(DateUtil.CALDAV_DATE, "20240524") == datetime.datetime(2024, 5, 24)
+        assert DateUtil._parse_fixed_width(DateUtil.SQLITE_DATETIME, "2024-05-24 09:54:59") == datetime.datetime(
+            2024, 5, 24, 9, 54, 59)
+
+        # Anything else is left to strptime
+        assert DateUtil._parse_fixed_width(DateUtil.CALDAV_DATE, "20240230") is None
+        assert DateUtil._parse_fixed_width(DateUtil.CALDAV_DATE, "2024 524") is None
+        assert DateUtil._parse_fixed_width(DateUtil.APPLE_DATETIME, "Friday, 24 May 2024 at 09:54:59") is None
+
     def test_emit(self):
         logging.basicConfig(
             level=logging.DEBUG,
@@ -9,6 +9,7 @@ import pytest
 from decouple import config
 
 from taskbridge import helpers
+from taskbridge.notes.model import note as note_module
 from taskbridge.notes.model import notescript
 from taskbridge.notes.model.note import Note
 from taskbridge.notes.model.notefolder import LocalNoteFolder, NoteFolder
@@ -260,6 +261,31 @@ That was a ladybird"""
         # Clean up
         TestNote._clean_artefacts()
 
+    def test_upsert_remote_unchanged(self, tmp_path):
+        modified = datetime.datetime(2024, 5, 24, 9, 54, 59)
+        note = Note('Unchanged', modified, modified, body_markdown='# Unchanged\nBody')
+        remote_note = tmp_path / 'Unchanged.md'
+
+        with mock.patch.object(note_module, '_write_file', wraps=note_module._write_file) as write:
+            # New note is written
+            success, data = note.upsert_remote(tmp_path)
+            assert success is True
+            assert write.call_count == 1
+
+            # Unchanged note is not rewritten, but its modification date is still updated
+            os.utime(remote_note, (0, 0))
+            success, data = note.upsert_remote(tmp_path)
+            assert success is True
+            assert write.call_count == 1
+            assert os.path.getmtime(remote_note) == modified.timestamp()
+
+            # Changed note is rewritten
+            note.body_markdown = '# Unchanged\nNew body'
+            success, data = note.upsert_remote(tmp_path)
+            assert success is True
+            assert write.call_count == 2
+            assert remote_note.read_text() == '# Unchanged\nNew body'
+
     @pytest.mark.skipif(TEST_ENV != 'local', reason="Requires local filesystem.")
     def test___str__(self):
         new_note = TestNote._create_note_from_local()
@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 from unittest import mock
 
@@ -128,3 +129,32 @@ class TestNoteController:
             succeed = False
             success, data = NoteController.sync_notes()
             assert success is False
+
+    def test_sync_notes_sequential(self):
+        synced = []
+
+        # Each folder is synchronised in turn on the calling thread, and results are merged across folders
+        def mock_sync_notes(inst):
+            synced.append((inst.local_folder.name, threading.get_ident()))
+            if inst.local_folder.name == 'Fail':
+                return False, 'Fail'
+            return True, {'remote_added': [inst.local_folder.name], 'local_added': []}
+
+        with mock.patch('{}.NoteFolder.sync_notes'.format(TestNoteController.FOLDER_BASE), mock_sync_notes):
+            NoteFolder.FOLDER_LIST.clear()
+            for name in ['One', 'Two', 'Three']:
+                NoteFolder(LocalNoteFolder(name), RemoteNoteFolder(Path("/tmp/test"), name), NoteFolder.SYNC_NONE)
+
+            success, data = NoteController.sync_notes()
+            assert success is True
+            assert data['remote_added'] == ['One', 'Two', 'Three']
+            assert synced == [(name, threading.get_ident()) for name in ['One', 'Two', 'Three']]
+
+            # Folders after a failure are not synchronised
+            synced.clear()
+            NoteFolder(LocalNoteFolder('Fail'), RemoteNoteFolder(Path("/tmp/test"), 'Fail'), NoteFolder.SYNC_NONE)
+            NoteFolder.FOLDER_LIST.insert(1, NoteFolder.FOLDER_LIST.pop())
+            success, data = NoteController.sync_notes()
+            assert success is False
+            assert [name for name, thread in synced] == ['One', 'Fail']
+            NoteFolder.FOLDER_LIST.clear()
@@ -4,6 +4,7 @@ import os.path
 import pathlib
 import shutil
 import sqlite3
+import threading
 from contextlib import closing
 from pathlib import Path
 from unittest import mock
@@ -392,6 +393,19 @@ end tell"""
         assert success is True
         assert len(folders) > 1
 
+    def test_load_remote_folders_missing_root(self, tmp_path):
+        # A remote notes folder which does not exist yet has no folders
+        success, folders = NoteFolder.load_remote_folders(tmp_path / 'Missing')
+        assert success is True
+        assert folders == []
+
+        # Other errors reading the remote notes folder are reported
+        not_a_folder = tmp_path / 'file'
+        not_a_folder.write_text('')
+        success, data = NoteFolder.load_remote_folders(not_a_folder)
+        assert success is False
+        assert 'NotADirectoryError' in data
+
     @pytest.mark.skipif(TEST_ENV != 'local', reason="Requires Mac system with iCloud and local filesystem.")
     def test_assoc_local_remote(self):
         remote_location = Path("/tmp/Notes")
@@ -570,7 +584,7 @@ end tell"""
         # Fail
 
         class MockSqlite3:
-            def connect(self):
+            def connect(self, timeout=None):
                 raise MockSqlite3.OperationalError
 
             class OperationalError(BaseException):
@@ -621,7 +635,7 @@ end tell"""
 
         # Fail
         class MockSqlite3:
-            def connect(self):
+            def connect(self, timeout=None):
                 raise MockSqlite3.OperationalError
 
             class OperationalError(BaseException):
@@ -668,7 +682,7 @@ end tell"""
 
         # Fail - SQL Error
         class MockSqlite3:
-            def connect(self):
+            def connect(self, timeout=None):
                 raise MockSqlite3.OperationalError
 
             class OperationalError(BaseException):
@@ -719,7 +733,7 @@ end tell"""
 
         # Fail - SQL Error
         class MockSqlite3:
-            def connect(self):
+            def connect(self, timeout=None):
                 raise MockSqlite3.OperationalError
 
             class OperationalError(BaseException):
@@ -820,7 +834,7 @@ end tell"""
 
         # Fail - SQL Error
         class MockSqlite3:
-            def connect(self):
+            def connect(self, timeout=None):
                 raise MockSqlite3.OperationalError
 
             class OperationalError(BaseException):
@@ -879,7 +893,7 @@ end tell"""
 
         # Fail - SQL Error
         class MockSqlite3:
-            def connect(self):
+            def connect(self, timeout=None):
                 raise MockSqlite3.OperationalError
 
             class OperationalError(BaseException):
@@ -890,6 +904,34 @@ end tell"""
             success, data = NoteFolder.persist_notes()
             assert success is False
 
+    def test_persist_notes_locked(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(helpers, 'DATA_LOCATION', tmp_path)
+        NoteFolder.FOLDER_LIST.clear()
+        assert NoteFolder.seed_note_table()[0] is True
+
+        delete_started = threading.Event()
+        results = []
+        connect = sqlite3.connect
+
+        def mock_connect(*args, **kwargs):
+            connection = connect(*args, **kwargs)
+            connection.set_trace_callback(lambda sql: delete_started.set() if sql.startswith('DELETE') else None)
+            return connection
+
+        # Notes are persisted while another sync holds a write lock on the database, and wait for it to be released
+        with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            with mock.patch('sqlite3.connect', mock_connect):
+                thread = threading.Thread(target=lambda: results.append(NoteFolder.persist_notes()))
+                thread.start()
+                assert delete_started.wait(10)
+                # The persisting thread cannot finish while the lock is held, unless it gave up on the lock
+                thread.join(0.2)
+                assert thread.is_alive()
+            connection.commit()
+        thread.join()
+        assert results[0][0] is True, results[0][1]
+
     @pytest.mark.skipif(TEST_ENV != 'local', reason="Requires Mac system with iCloud and local filesystem.")
     def test_delete_local_notes(self):
         NoteFolder.FOLDER_LIST.clear()
@@ -925,7 +967,7 @@ end tell"""
 
         # Fail - SQL Error
         class MockSqlite3:
-            def connect(self):
+            def connect(self, timeout=None):
                 raise MockSqlite3.OperationalError
 
             class OperationalError(BaseException):
@@ -973,7 +1015,7 @@ end tell"""
 
         # Fail - SQL Error
         class MockSqlite3:
-            def connect(self):
+            def connect(self, timeout=None):
                 raise MockSqlite3.OperationalError
 
             class OperationalError(BaseException):
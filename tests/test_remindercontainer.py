@@ -2,8 +2,10 @@ import datetime
 import os
 import json
 import sqlite3
+import threading
 from contextlib import closing
 from pathlib import Path
+from unittest import mock
 
 import caldav
 import pytest
@@ -405,6 +407,34 @@ class TestReminderContainer:
         except sqlite3.OperationalError as e:
             print(e)
 
+    def test_persist_reminders_locked(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(helpers, 'DATA_LOCATION', tmp_path)
+        ReminderContainer.CONTAINER_LIST.clear()
+        assert ReminderContainer.seed_reminder_table()[0] is True
+
+        delete_started = threading.Event()
+        results = []
+        connect = sqlite3.connect
+
+        def mock_connect(*args, **kwargs):
+            connection = connect(*args, **kwargs)
+            connection.set_trace_callback(lambda sql: delete_started.set() if sql.startswith('DELETE') else None)
+            return connection
+
+        # Reminders are persisted while another sync holds a write lock on the database, and wait for it to be released
+        with closing(sqlite3.connect(helpers.db_folder())) as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            with mock.patch('sqlite3.connect', mock_connect):
+                thread = threading.Thread(target=lambda: results.append(ReminderContainer.persist_reminders()))
+                thread.start()
+                assert delete_started.wait(10)
+                # The persisting thread cannot finish while the lock is held, unless it gave up on the lock
+                thread.join(0.2)
+                assert thread.is_alive()
+            connection.commit()
+        thread.join()
+        assert results[0][0] is True, results[0][1]
+
     @pytest.mark.skipif(TEST_ENV != 'local', reason="Requires CalDAV credentials")
     def test__delete_remote_containers(self):
         TestReminderContainer.__reset_state()
@@ -725,6 +755,38 @@ class TestReminderContainer:
         except sqlite3.OperationalError as e:
             print(e)
 
+    def test__delete_saved_reminders(self):
+        ReminderContainer.CONTAINER_LIST.clear()
+        ReminderContainer(LocalList("Work"), RemoteCalendar(calendar_name="Work"), True)
+        ReminderContainer(LocalList("Reminders"), RemoteCalendar(calendar_name="Tasks"), True)
+        ReminderContainer(LocalList("Unlinked"), None, True)
+        saved_reminders = [
+            {'local_container': 'Work', 'remote_container': 'Work', 'local_name': 'One'},
+            {'local_container': 'Reminders', 'remote_container': 'Tasks', 'local_name': 'Two'},
+            {'local_container': 'Work', 'remote_container': 'Work', 'local_name': 'Three'},
+            {'local_container': 'Gone', 'remote_container': 'Gone', 'local_name': 'Four'}
+        ]
+        deleted_remote = {}
+        deleted_local = {}
+
+        # noinspection PyUnusedLocal
+        def mock_delete_remote_reminders(container_saved_local, container, result):
+            deleted_remote[container.local_list.name] = [r['local_name'] for r in container_saved_local]
+
+        # noinspection PyUnusedLocal
+        def mock_delete_local_reminders(container_saved_remote, container, result):
+            deleted_local[container.remote_calendar.name] = [r['local_name'] for r in container_saved_remote]
+
+        # Saved reminders are passed to the container they were saved from, and unlinked containers are skipped
+        with mock.patch.object(ReminderContainer, '_delete_remote_reminders', mock_delete_remote_reminders), \
+                mock.patch.object(ReminderContainer, '_delete_local_reminders', mock_delete_local_reminders):
+            ReminderContainer._delete_saved_reminders(saved_reminders, {})
+        assert deleted_remote == {'Work': ['One', 'Three'], 'Reminders': ['Two']}
+        assert deleted_local == {'Work': ['One', 'Three'], 'Tasks': ['Two']}
+
+        # Clean up
+        ReminderContainer.CONTAINER_LIST.clear()
+
     @pytest.mark.skipif(TEST_ENV != 'local', reason="Requires Mac system with iCloud")
     def test_get_saved_reminders(self):
         TestReminderContainer.__reset_state()
@@ -857,6 +919,49 @@ class TestReminderContainer:
             except sqlite3.OperationalError as e:
                 print(e)
 
+    def test_get_remote_task(self):
+        def mock_task(uid, summary):
+            component = {'uid': uid}
+            if summary is not None:
+                component['summary'] = summary
+            return mock.Mock(icalendar_component=component)
+
+        first = mock_task('uid-1', 'Buy milk')
+        duplicate = mock_task('uid-1', 'Buy milk again')
+        longer = mock_task('uid-2', 'Buy milk and eggs')
+        no_summary = mock_task('uid-3', None)
+        tasks = [first, duplicate, longer, no_summary]
+
+        # noinspection PyUnusedLocal
+        def mock_search(todo=True, uid=None, summary=None):
+            if uid is not None:
+                return [t for t in tasks if t.icalendar_component['uid'] == uid]
+            # CalDav text-match is a case-insensitive substring match
+            return [t for t in tasks if summary.lower() in str(t.icalendar_component.get('summary', '')).lower()]
+
+        cal_obj = mock.Mock(search=mock_search, todos=lambda: tasks)
+        ReminderContainer.CONTAINER_LIST.clear()
+        container = ReminderContainer(LocalList("Test"), RemoteCalendar(cal_obj=cal_obj, calendar_name="Test"), True)
+
+        def check_lookups():
+            # The first task with a UID is returned
+            assert container.get_remote_task('uid-1') is first
+            # Names match the whole summary, ignoring case, and tasks without a summary are skipped
+            assert container.get_remote_task('uid-9', 'BUY MILK AND EGGS') is longer
+            assert container.get_remote_task('uid-9', 'milk') is None
+            assert container.get_remote_task('uid-9', 'None') is None
+            assert container.get_remote_task('uid-9') is None
+
+        # Searching the server and looking up fetched tasks give the same results
+        check_lookups()
+        with mock.patch('taskbridge.reminders.model.reminder.Reminder.create_from_remote',
+                        lambda task: mock.Mock(uuid=task.icalendar_component['uid'])):
+            container.load_remote_reminders()
+        check_lookups()
+
+        # Clean up
+        ReminderContainer.CONTAINER_LIST.clear()
+
     @pytest.mark.skipif(TEST_ENV != 'local', reason="Requires Mac system with iCloud")
     def test_load_local_reminders(self):
         TestReminderContainer.__reset_state()
@@ -1175,3 +1280,26 @@ class TestReminderContainer:
 
         success, data = ReminderContainer.get_saved_reminders()
         assert success is False
+
+    def test_find_reminder(self):
+        modified = datetime.datetime(2024, 1, 1, 9, 0, 0)
+        reminders = [Reminder('uuid-1', 'First', None, modified, None, None, None, None),
+                     Reminder('uuid-2', 'Second', None, modified, None, None, None, None),
+                     Reminder('uuid-3', 'First', None, modified, None, None, None, None)]
+        index = ReminderContainer._index_reminders(reminders)
+
+        # Match by UUID
+        probe = Reminder('uuid-2', 'Other', None, modified, None, None, None, None)
+        assert ReminderContainer._find_reminder(reminders, index, probe) is reminders[1]
+
+        # Match by name returns the first reminder with that name
+        probe = Reminder(None, 'First', None, modified, None, None, None, None)
+        assert ReminderContainer._find_reminder(reminders, index, probe) is reminders[0]
+
+        # Earliest of a UUID and a name match wins
+        probe = Reminder('uuid-3', 'Second', None, modified, None, None, None, None)
+        assert ReminderContainer._find_reminder(reminders, index, probe) is reminders[1]
+
+        # No match
+        probe = Reminder('uuid-4', 'Fourth', None, modified, None, None, None, None)
+        assert ReminderContainer._find_reminder(reminders, index, probe) is None
@@ -1,3 +1,4 @@
+import threading
 from unittest import mock
 
 import caldav.lib.error
@@ -182,6 +183,40 @@ class TestReminderController:
             success, data = ReminderController.sync_reminders()
             assert success is True
 
+    def test_sync_reminders_sequential(self):
+        synced = []
+
+        class MockReminderContainer:
+            def __init__(self, name, result):
+                self.name = name
+                self.result = result
+
+            # noinspection PyUnusedLocal
+            def sync_reminders(self, fail: str = None):
+                synced.append((self.name, threading.get_ident()))
+                return self.result
+
+        containers = [
+            MockReminderContainer('One', (True, {'remote_added': ['One'], 'local_added': []})),
+            MockReminderContainer('NoSync', (True, 'Container NoSync is set to NO SYNC')),
+            MockReminderContainer('Two', (True, {'remote_added': ['Two'], 'local_updated': ['Two']}))
+        ]
+
+        # Each container is synchronised in turn on the calling thread, and results are merged across containers
+        with mock.patch('{}.ReminderContainer.CONTAINER_LIST'.format(TestReminderController.CONTAINER_BASE), containers):
+            success, data = ReminderController.sync_reminders()
+            assert success is True
+            assert data['remote_added'] == ['One', 'Two']
+            assert data['local_updated'] == ['Two']
+            assert synced == [(name, threading.get_ident()) for name in ['One', 'NoSync', 'Two']]
+
+            # Containers after a failure are not synchronised
+            synced.clear()
+            containers.insert(1, MockReminderContainer('Fail', (False, 'Fail')))
+            success, data = ReminderController.sync_reminders()
+            assert success is False
+            assert [name for name, thread in synced] == ['One', 'Fail']
+
     def test_sync_reminders_to_db(self):
         succeed = True
 